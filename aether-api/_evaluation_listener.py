@@ -0,0 +1,94 @@
+"""Wait for the worker's evaluations in the API test scripts."""
+import asyncio
+from typing import Final, Optional
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+# Channel dev_notify_trigger.py's trigger notifies with the trace id
+EVALUATION_READY_CHANNEL: Final[str] = "evaluation_ready"
+NOTIFY_TRIGGER: Final[str] = "notify_after_evaluation_insert"
+
+# How often to check for the evaluation when the notify trigger isn't installed
+POLL_INTERVAL_SECONDS: Final[float] = 0.5
+
+
+async def connect() -> asyncpg.Connection:
+    """Open a plain asyncpg connection to the application database."""
+    # asyncpg takes a plain postgresql:// DSN, not the SQLAlchemy driver URL
+    dsn = make_url(settings.database_url).set(drivername="postgresql")
+    return await asyncpg.connect(dsn.render_as_string(hide_password=False))
+
+
+class EvaluationListener:
+    """
+    Wait for evaluations to be written.
+
+    If the dev-only notify trigger is installed (python dev_notify_trigger.py
+    install), LISTENs on EVALUATION_READY_CHANNEL over a dedicated connection;
+    enter it before ingesting the trace so the notification can't be missed.
+    Otherwise checks for the evaluation every POLL_INTERVAL_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        self._conn: Optional[asyncpg.Connection] = None
+        self._notify = False
+        # Set when a trace's notification arrives, whether or not anyone is waiting yet
+        self._done: dict[str, asyncio.Event] = {}
+
+    async def __aenter__(self) -> "EvaluationListener":
+        self._conn = await connect()
+        self._notify = await self._conn.fetchval(
+            "SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = $1)", NOTIFY_TRIGGER
+        )
+        if self._notify:
+            await self._conn.add_listener(EVALUATION_READY_CHANNEL, self._on_notify)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._notify:
+            await self._conn.remove_listener(EVALUATION_READY_CHANNEL, self._on_notify)
+        await self._conn.close()
+
+    def _event(self, trace_id: str) -> asyncio.Event:
+        return self._done.setdefault(trace_id, asyncio.Event())
+
+    def _on_notify(self, conn, pid, channel, payload: str) -> None:
+        self._event(payload).set()
+
+    async def wait_for(self, trace_id: str, timeout: float) -> bool:
+        """
+        Wait until the evaluation for a trace has been committed.
+
+        Args:
+            trace_id: Trace to wait for
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            True if the evaluation was written, False on timeout
+        """
+        if not self._notify:
+            return await self._poll(trace_id, timeout)
+        try:
+            await asyncio.wait_for(self._event(trace_id).wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._done.pop(trace_id, None)
+
+    async def _poll(self, trace_id: str, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if await self._conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM evaluations WHERE trace_id = $1)", UUID(trace_id)
+            ):
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(POLL_INTERVAL_SECONDS, remaining))
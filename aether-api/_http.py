@@ -0,0 +1,49 @@
+"""Shared HTTP client for the API test scripts."""
+import asyncio
+from typing import Any, Coroutine, Optional, TypeVar
+
+import httpx
+
+API_BASE_URL = "http://127.0.0.1:8000"
+API_KEY = "ae_test_key_development_12345"  # From seed_data.py
+
+# For request bodies the scripts serialize once with orjson and send as content=
+JSON_HEADERS = {"content-type": "application/json"}
+
+T = TypeVar("T")
+
+# One client per script run so every request reuses the same pooled connection
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared API client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            headers={"X-API-Key": API_KEY},
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared API client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a script's main coroutine, closing the shared client before the loop exits."""
+    async def _run() -> T:
+        try:
+            return await main
+        finally:
+            await close_client()
+
+    return asyncio.run(_run())
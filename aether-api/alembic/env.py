@@ -1,6 +1,7 @@
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
+from sqlalchemy.engine import make_url
 from sqlalchemy import pool
 
 from alembic import context
@@ -41,7 +42,11 @@ def get_url():
     from dotenv import load_dotenv
 
     load_dotenv()
-    return os.getenv("DATABASE_URL", "")
+    url = os.getenv("DATABASE_URL", "")
+    if not url:
+        return url
+    # Migrate with the same psycopg (3) driver as the app's sync engine
+    return make_url(url).set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
 
 
 def run_migrations_offline() -> None:
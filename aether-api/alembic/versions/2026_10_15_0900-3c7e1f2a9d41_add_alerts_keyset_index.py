@@ -0,0 +1,31 @@
+"""add alerts keyset pagination index
+
+Revision ID: 3c7e1f2a9d41
+Revises: b21bc001d252
+Create Date: 2026-10-15 09:00:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7e1f2a9d41'
+down_revision: Union[str, None] = 'b21bc001d252'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_alerts_project_created_id',
+        'alerts',
+        ['project_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_project_created_id', table_name='alerts')
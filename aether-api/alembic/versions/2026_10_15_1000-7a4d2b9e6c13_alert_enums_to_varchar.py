@@ -0,0 +1,78 @@
+"""store alert type and severity as varchar with check constraints
+
+Revision ID: 7a4d2b9e6c13
+Revises: 3c7e1f2a9d41
+Create Date: 2026-10-15 10:00:41.902117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4d2b9e6c13'
+down_revision: Union[str, None] = '3c7e1f2a9d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ALERT_TYPES = ('quality_drop', 'cost_spike', 'hallucination', 'high_latency', 'error_rate')
+SEVERITIES = ('info', 'warning', 'critical')
+
+
+def _in_list(column: str, values: tuple) -> str:
+    return f"{column} IN ({', '.join(repr(v) for v in values)})"
+
+
+def upgrade() -> None:
+    # The native enums stored member names (e.g. 'COST_SPIKE'); store values instead
+    op.alter_column(
+        'alerts', 'alert_type',
+        type_=sa.String(length=32),
+        postgresql_using='lower(alert_type::text)',
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'alerts', 'severity',
+        type_=sa.String(length=32),
+        postgresql_using='lower(severity::text)',
+        existing_nullable=False,
+    )
+    op.execute('DROP TYPE alerttype')
+    op.execute('DROP TYPE severity')
+
+    op.create_check_constraint('ck_alerts_alert_type', 'alerts', _in_list('alert_type', ALERT_TYPES))
+    op.create_check_constraint('ck_alerts_severity', 'alerts', _in_list('severity', SEVERITIES))
+
+    op.create_index(
+        'idx_alerts_project_filters',
+        'alerts',
+        ['project_id', 'alert_type', 'severity', 'resolved', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_project_filters', table_name='alerts')
+    op.drop_constraint('ck_alerts_severity', 'alerts', type_='check')
+    op.drop_constraint('ck_alerts_alert_type', 'alerts', type_='check')
+
+    alert_type = sa.Enum('QUALITY_DROP', 'COST_SPIKE', 'HALLUCINATION', 'HIGH_LATENCY', 'ERROR_RATE', name='alerttype')
+    severity = sa.Enum('INFO', 'WARNING', 'CRITICAL', name='severity')
+    alert_type.create(op.get_bind())
+    severity.create(op.get_bind())
+
+    op.alter_column(
+        'alerts', 'alert_type',
+        type_=alert_type,
+        postgresql_using='upper(alert_type)::alerttype',
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'alerts', 'severity',
+        type_=severity,
+        postgresql_using='upper(severity)::severity',
+        existing_nullable=False,
+    )
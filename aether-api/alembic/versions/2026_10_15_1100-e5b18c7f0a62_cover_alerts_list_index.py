@@ -0,0 +1,39 @@
+"""include alert filter columns in the alerts list index
+
+Revision ID: e5b18c7f0a62
+Revises: 7a4d2b9e6c13
+Create Date: 2026-10-15 11:00:07.561934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b18c7f0a62'
+down_revision: Union[str, None] = '7a4d2b9e6c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_alerts_project_created_id', table_name='alerts')
+    op.create_index(
+        'idx_alerts_project_created_id',
+        'alerts',
+        ['project_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_include=['alert_type', 'severity', 'resolved'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_project_created_id', table_name='alerts')
+    op.create_index(
+        'idx_alerts_project_created_id',
+        'alerts',
+        ['project_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
@@ -0,0 +1,53 @@
+"""store timestamps as timestamptz with server-side defaults
+
+Revision ID: 0f6c3a8b2d57
+Revises: e5b18c7f0a62
+Create Date: 2026-10-15 12:00:33.140872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f6c3a8b2d57'
+down_revision: Union[str, None] = 'e5b18c7f0a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Existing naive values were written with datetime.utcnow(), so they are UTC
+TIMESTAMP_COLUMNS = [
+    ('organizations', 'created_at'),
+    ('projects', 'created_at'),
+    ('users', 'created_at'),
+    ('alerts', 'created_at'),
+    ('rag_traces', 'created_at'),
+    ('evaluations', 'evaluated_at'),
+    ('alert_configs', 'created_at'),
+    ('alert_configs', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=sa.text('now()'),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=None,
+            existing_nullable=False,
+        )
@@ -0,0 +1,34 @@
+"""include latency_ms in the traces project/created index
+
+Revision ID: 4b9e2d1c7a85
+Revises: 0f6c3a8b2d57
+Create Date: 2026-10-15 13:00:19.774306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b9e2d1c7a85'
+down_revision: Union[str, None] = '0f6c3a8b2d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_project_created', table_name='rag_traces')
+    op.create_index(
+        'idx_project_created',
+        'rag_traces',
+        ['project_id', 'created_at'],
+        unique=False,
+        postgresql_include=['latency_ms'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_project_created', table_name='rag_traces')
+    op.create_index('idx_project_created', 'rag_traces', ['project_id', 'created_at'], unique=False)
@@ -0,0 +1,46 @@
+"""add per-project hourly metrics materialized view
+
+Revision ID: 9d3f6a0e1b28
+Revises: 4b9e2d1c7a85
+Create Date: 2026-10-15 14:00:52.308117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3f6a0e1b28'
+down_revision: Union[str, None] = '4b9e2d1c7a85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_project_hourly AS
+        SELECT
+            t.project_id,
+            date_trunc('hour', t.created_at) AS hour,
+            count(*) AS traces,
+            coalesce(sum(e.evaluation_cost_usd), 0) AS cost_usd,
+            count(e.id) FILTER (WHERE e.hallucination_detected) AS hallucinations,
+            count(e.id) AS evaluations
+        FROM rag_traces t
+        LEFT JOIN evaluations e ON e.trace_id = t.id
+        GROUP BY 1, 2
+    """)
+    # Required for REFRESH ... CONCURRENTLY
+    op.create_index(
+        'idx_mv_project_hourly_project_hour',
+        'mv_project_hourly',
+        ['project_id', 'hour'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_mv_project_hourly_project_hour', table_name='mv_project_hourly')
+    op.execute("DROP MATERIALIZED VIEW mv_project_hourly")
@@ -0,0 +1,67 @@
+"""replace hourly metrics materialized view with an incremental roll-up table
+
+Revision ID: c2a7e5f39d10
+Revises: 9d3f6a0e1b28
+Create Date: 2026-10-15 15:00:26.619043
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2a7e5f39d10'
+down_revision: Union[str, None] = '9d3f6a0e1b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+HOURLY_BUCKETS = """
+    SELECT
+        t.project_id,
+        date_trunc('hour', t.created_at) AS hour,
+        count(*) AS traces,
+        coalesce(sum(e.evaluation_cost_usd), 0) AS cost_usd,
+        count(e.id) FILTER (WHERE e.hallucination_detected) AS hallucinations,
+        count(e.id) AS evaluations
+    FROM rag_traces t
+    LEFT JOIN evaluations e ON e.trace_id = t.id
+    GROUP BY 1, 2
+"""
+
+
+def upgrade() -> None:
+    op.drop_index('idx_mv_project_hourly_project_hour', table_name='mv_project_hourly')
+    op.execute("DROP MATERIALIZED VIEW mv_project_hourly")
+
+    op.create_table('project_hourly_rollup',
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('hour', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('traces', sa.Integer(), nullable=False),
+    sa.Column('cost_usd', sa.Numeric(precision=12, scale=6), nullable=False),
+    sa.Column('hallucinations', sa.Integer(), nullable=False),
+    sa.Column('evaluations', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
+    sa.PrimaryKeyConstraint('project_id', 'hour')
+    )
+
+    # Backfill all history once; the worker only recomputes recent hours after this
+    op.execute(
+        "INSERT INTO project_hourly_rollup "
+        "(project_id, hour, traces, cost_usd, hallucinations, evaluations)"
+        + HOURLY_BUCKETS
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('project_hourly_rollup')
+
+    op.execute("CREATE MATERIALIZED VIEW mv_project_hourly AS" + HOURLY_BUCKETS)
+    op.create_index(
+        'idx_mv_project_hourly_project_hour',
+        'mv_project_hourly',
+        ['project_id', 'hour'],
+        unique=True,
+    )
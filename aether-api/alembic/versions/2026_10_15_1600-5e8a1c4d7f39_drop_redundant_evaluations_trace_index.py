@@ -0,0 +1,27 @@
+"""drop redundant evaluations trace_id index
+
+Revision ID: 5e8a1c4d7f39
+Revises: c2a7e5f39d10
+Create Date: 2026-10-15 16:00:11.205487
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a1c4d7f39'
+down_revision: Union[str, None] = 'c2a7e5f39d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The unique constraint on trace_id (the ON CONFLICT target) already indexes it
+    op.drop_index('idx_trace', table_name='evaluations')
+
+
+def downgrade() -> None:
+    op.create_index('idx_trace', 'evaluations', ['trace_id'], unique=False)
@@ -0,0 +1,48 @@
+"""cover the hourly roll-up's trace and evaluation scans
+
+Revision ID: 8c1f4e7a2b96
+Revises: 5e8a1c4d7f39
+Create Date: 2026-10-15 17:00:42.318064
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1f4e7a2b96'
+down_revision: Union[str, None] = '5e8a1c4d7f39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ix_rag_traces_created_at duplicated idx_created_at
+    op.drop_index('ix_rag_traces_created_at', table_name='rag_traces')
+    op.drop_index('idx_created_at', table_name='rag_traces')
+    op.create_index(
+        'idx_created_at',
+        'rag_traces',
+        ['created_at'],
+        unique=False,
+        postgresql_include=['project_id', 'id'],
+    )
+    op.create_index(
+        'idx_evaluations_trace_rollup',
+        'evaluations',
+        ['trace_id'],
+        unique=False,
+        postgresql_include=['evaluation_cost_usd', 'hallucination_detected'],
+    )
+    # Refresh planner statistics so the new indexes are picked up right away
+    op.execute('ANALYZE rag_traces')
+    op.execute('ANALYZE evaluations')
+
+
+def downgrade() -> None:
+    op.drop_index('idx_evaluations_trace_rollup', table_name='evaluations')
+    op.drop_index('idx_created_at', table_name='rag_traces')
+    op.create_index('idx_created_at', 'rag_traces', ['created_at'], unique=False)
+    op.create_index('ix_rag_traces_created_at', 'rag_traces', ['created_at'], unique=False)
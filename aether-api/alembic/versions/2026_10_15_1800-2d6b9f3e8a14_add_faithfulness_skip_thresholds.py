@@ -0,0 +1,31 @@
+"""add faithfulness skip thresholds to alert_configs
+
+Revision ID: 2d6b9f3e8a14
+Revises: 8c1f4e7a2b96
+Create Date: 2026-10-15 18:00:27.940135
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d6b9f3e8a14'
+down_revision: Union[str, None] = '8c1f4e7a2b96'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Server defaults only backfill existing rows; new rows get the model defaults
+    op.add_column('alert_configs', sa.Column('faithfulness_skip_overlap', sa.Float(), nullable=True, server_default='0.9'))
+    op.add_column('alert_configs', sa.Column('faithfulness_skip_min_words', sa.Integer(), nullable=False, server_default='20'))
+    op.alter_column('alert_configs', 'faithfulness_skip_overlap', server_default=None)
+    op.alter_column('alert_configs', 'faithfulness_skip_min_words', server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column('alert_configs', 'faithfulness_skip_min_words')
+    op.drop_column('alert_configs', 'faithfulness_skip_overlap')
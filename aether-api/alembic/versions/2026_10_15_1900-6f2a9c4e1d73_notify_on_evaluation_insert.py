@@ -0,0 +1,40 @@
+"""notify evaluation_ready on evaluation insert
+
+Revision ID: 6f2a9c4e1d73
+Revises: 2d6b9f3e8a14
+Create Date: 2026-10-15 19:00:41.582306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f2a9c4e1d73'
+down_revision: Union[str, None] = '2d6b9f3e8a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Listeners get the trace id once the worker's insert commits
+    op.execute("""
+        CREATE FUNCTION notify_evaluation_ready() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('evaluation_ready', NEW.trace_id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER notify_after_evaluation_insert
+        AFTER INSERT ON evaluations
+        FOR EACH ROW EXECUTE FUNCTION notify_evaluation_ready()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER notify_after_evaluation_insert ON evaluations")
+    op.execute("DROP FUNCTION notify_evaluation_ready()")
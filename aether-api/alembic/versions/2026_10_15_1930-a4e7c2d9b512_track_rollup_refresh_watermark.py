@@ -0,0 +1,34 @@
+"""track roll-up refresh watermark and index evaluated_at
+
+Revision ID: a4e7c2d9b512
+Revises: 6f2a9c4e1d73
+Create Date: 2026-10-15 19:30:12.664018
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e7c2d9b512'
+down_revision: Union[str, None] = '6f2a9c4e1d73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('project_hourly_rollup', sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.create_index(
+        'idx_evaluations_evaluated_at',
+        'evaluations',
+        ['evaluated_at'],
+        unique=False,
+        postgresql_include=['trace_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_evaluations_evaluated_at', table_name='evaluations')
+    op.drop_column('project_hourly_rollup', 'refreshed_at')
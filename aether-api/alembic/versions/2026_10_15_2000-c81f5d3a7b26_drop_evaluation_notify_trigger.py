@@ -0,0 +1,41 @@
+"""drop evaluation_ready notify trigger
+
+Revision ID: c81f5d3a7b26
+Revises: a4e7c2d9b512
+Create Date: 2026-10-15 20:00:12.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f5d3a7b26'
+down_revision: Union[str, None] = 'a4e7c2d9b512'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only the test scripts listen, so production shouldn't pay a pg_notify per
+    # evaluation; dev databases opt in with dev_notify_trigger.py
+    op.execute("DROP TRIGGER IF EXISTS notify_after_evaluation_insert ON evaluations")
+    op.execute("DROP FUNCTION IF EXISTS notify_evaluation_ready()")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE FUNCTION notify_evaluation_ready() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('evaluation_ready', NEW.trace_id::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER notify_after_evaluation_insert
+        AFTER INSERT ON evaluations
+        FOR EACH ROW EXECUTE FUNCTION notify_evaluation_ready()
+    """)
@@ -1,14 +1,20 @@
 """
 Alert Configuration API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from uuid import UUID
 
 from app.core.database import get_db
-from app.models import AlertConfig, Project
+from app.core.redis_client import get_redis
+from app.models import AlertConfig
 from app.schemas.alert_config import AlertConfigCreate, AlertConfigUpdate, AlertConfigResponse
+from app.services.cache_service import CacheService
+import redis.asyncio as redis
 
 router = APIRouter()
 
@@ -16,80 +22,104 @@ router = APIRouter()
 @router.get("/{project_id}", response_model=AlertConfigResponse)
 async def get_alert_config(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Get alert configuration for a project.
+
+    Served from Redis when cached; create and update write the new config
+    through to the cache and delete invalidates it.
     """
-    # Verify project exists
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    cached = await CacheService.get_alert_config(redis_conn, project_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Get or create alert config in one race-free statement. The no-op update on
+    # conflict makes RETURNING yield the existing row instead of nothing.
+    # The projects FK rejects unknown projects, so no separate existence check.
+    try:
+        alert_config = (
+            await db.execute(
+                insert(AlertConfig)
+                .values(project_id=project_id)
+                .on_conflict_do_update(
+                    index_elements=[AlertConfig.project_id],
+                    set_={"project_id": project_id}
+                )
+                .returning(AlertConfig)
+            )
+        ).scalar_one()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    # Get or create alert config
-    alert_config = db.query(AlertConfig).filter(AlertConfig.project_id == project_id).first()
-
-    if not alert_config:
-        # Create default alert config
-        alert_config = AlertConfig(project_id=project_id)
-        db.add(alert_config)
-        db.commit()
-        db.refresh(alert_config)
+    payload = AlertConfigResponse.model_validate(alert_config).model_dump_json()
+    await CacheService.set_alert_config(redis_conn, project_id, payload)
 
-    return alert_config
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/{project_id}", response_model=AlertConfigResponse, status_code=status.HTTP_201_CREATED)
 async def create_alert_config(
     project_id: UUID,
     config: AlertConfigCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Create alert configuration for a project.
     """
-    # Verify project exists
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    # Insert unless a config already exists. The unique project_id conflict is
+    # handled in the statement; the only remaining IntegrityError is the projects FK.
+    try:
+        alert_config = (
+            await db.execute(
+                insert(AlertConfig)
+                .values(project_id=project_id, **config.model_dump())
+                .on_conflict_do_nothing(index_elements=[AlertConfig.project_id])
+                .returning(AlertConfig)
+            )
+        ).scalar_one_or_none()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    # Check if config already exists
-    existing_config = db.query(AlertConfig).filter(AlertConfig.project_id == project_id).first()
-    if existing_config:
+    if not alert_config:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Alert configuration already exists for this project"
         )
 
-    # Create new config
-    alert_config = AlertConfig(
-        project_id=project_id,
-        **config.model_dump()
-    )
-    db.add(alert_config)
-    db.commit()
-    db.refresh(alert_config)
+    await db.commit()
+
+    payload = AlertConfigResponse.model_validate(alert_config).model_dump_json()
+    await CacheService.set_alert_config(redis_conn, project_id, payload)
 
-    return alert_config
+    return Response(content=payload, media_type="application/json", status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/{project_id}", response_model=AlertConfigResponse)
 async def update_alert_config(
     project_id: UUID,
     config: AlertConfigUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Update alert configuration for a project.
     """
     # Get existing config
-    alert_config = db.query(AlertConfig).filter(AlertConfig.project_id == project_id).first()
+    alert_config = (
+        await db.execute(select(AlertConfig).where(AlertConfig.project_id == project_id))
+    ).scalar_one_or_none()
 
     if not alert_config:
         raise HTTPException(
@@ -102,21 +132,27 @@ async def update_alert_config(
     for key, value in update_data.items():
         setattr(alert_config, key, value)
 
-    db.commit()
-    db.refresh(alert_config)
+    await db.commit()
+    await db.refresh(alert_config)
+
+    payload = AlertConfigResponse.model_validate(alert_config).model_dump_json()
+    await CacheService.set_alert_config(redis_conn, project_id, payload)
 
-    return alert_config
+    return Response(content=payload, media_type="application/json")
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_alert_config(
     project_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Delete alert configuration for a project (resets to defaults).
     """
-    alert_config = db.query(AlertConfig).filter(AlertConfig.project_id == project_id).first()
+    alert_config = (
+        await db.execute(select(AlertConfig).where(AlertConfig.project_id == project_id))
+    ).scalar_one_or_none()
 
     if not alert_config:
         raise HTTPException(
@@ -124,7 +160,8 @@ async def delete_alert_config(
             detail="Alert configuration not found"
         )
 
-    db.delete(alert_config)
-    db.commit()
+    await db.delete(alert_config)
+    await db.commit()
+    await CacheService.invalidate_alert_config(redis_conn, project_id)
 
     return None
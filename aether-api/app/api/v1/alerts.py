@@ -1,18 +1,31 @@
 """
 Alert Management API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import select, update, delete, func, desc, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
 from typing import Optional
 from uuid import UUID
+from datetime import datetime
 
 from app.core.database import get_db
+from app.core.redis_client import get_redis
 from app.models import Alert, Project, AlertType, Severity
-from app.schemas.alert import AlertResponse, AlertListResponse
+from app.schemas.alert import (
+    AlertResponse,
+    AlertListResponse,
+    AlertBulkResolveRequest,
+    AlertBulkResolveResponse,
+)
+from app.services.cache_service import CacheService
+import redis.asyncio as redis
 
 router = APIRouter()
 
+# Validates a page of alert rows in one pydantic-core call
+_ALERT_LIST_ADAPTER = TypeAdapter(list[AlertResponse])
+
 
 @router.get("/{project_id}", response_model=AlertListResponse)
 async def get_alerts(
@@ -22,7 +35,10 @@ async def get_alerts(
     resolved: Optional[bool] = None,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db)
+    created_before: Optional[datetime] = None,
+    cursor_id: Optional[UUID] = None,
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Get alerts for a project with optional filtering.
@@ -33,59 +49,138 @@ async def get_alerts(
     - resolved: Filter by resolution status
     - limit: Number of alerts to return (default 50, max 200)
     - offset: Number of alerts to skip (for pagination)
+    - created_before, cursor_id: Keyset cursor from a previous page's next_cursor.
+      When provided, offset is ignored and the page starts after that alert.
+
+    Responses are cached in Redis for a few seconds and invalidated whenever
+    an alert for the project is resolved, unresolved or deleted.
     """
-    # Verify project exists
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    if (created_before is None) != (cursor_id is None):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="created_before and cursor_id must be provided together"
         )
 
-    # Build query
-    query = db.query(Alert).filter(Alert.project_id == project_id)
+    cache_params = (
+        f"{alert_type}:{severity}:{resolved}:{limit}:{offset}:"
+        f"{created_before.isoformat() if created_before else None}:{cursor_id}"
+    )
+    cached = await CacheService.get_alert_list(redis_conn, project_id, cache_params)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Build filters
+    filters = [Alert.project_id == project_id]
 
     if alert_type:
-        query = query.filter(Alert.alert_type == alert_type)
+        filters.append(Alert.alert_type == alert_type)
 
     if severity:
-        query = query.filter(Alert.severity == severity)
+        filters.append(Alert.severity == severity)
 
     if resolved is not None:
-        query = query.filter(Alert.resolved == resolved)
-
-    # Get total count
-    total = query.count()
-
-    # Get unresolved count
-    unresolved_count = db.query(func.count(Alert.id)).filter(
-        Alert.project_id == project_id,
-        Alert.resolved == False
-    ).scalar()
-
-    # Get alerts ordered by created_at desc
-    alerts = query.order_by(desc(Alert.created_at)).limit(limit).offset(offset).all()
+        filters.append(Alert.resolved == resolved)
+
+    # Unresolved count is project-wide, independent of the filters above
+    unresolved_count_query = (
+        select(func.count(Alert.id))
+        .where(Alert.project_id == project_id, Alert.resolved == False)
+        .correlate(None)
+        .scalar_subquery()
+    )
+    total_count_query = (
+        select(func.count(Alert.id)).where(*filters).correlate(None).scalar_subquery()
+    )
+
+    # Fetch the page, the filtered total and the unresolved count in one round trip
+    if cursor_id is not None:
+        # Keyset pagination - the window count would only see rows past the cursor
+        page_query = (
+            select(
+                *Alert.__table__.columns,
+                total_count_query.label("total"),
+                unresolved_count_query.label("unresolved_count"),
+            )
+            .where(*filters)
+            .where(tuple_(Alert.created_at, Alert.id) < tuple_(created_before, cursor_id))
+        )
+    else:
+        page_query = (
+            select(
+                *Alert.__table__.columns,
+                func.count().over().label("total"),
+                unresolved_count_query.label("unresolved_count"),
+            )
+            .where(*filters)
+            .offset(offset)
+        )
 
-    return {
-        "alerts": alerts,
-        "total": total,
-        "unresolved_count": unresolved_count or 0
-    }
+    # Plain column rows rather than ORM entities - nothing to hydrate or lazy-load
+    rows = (
+        await db.execute(
+            page_query
+            .order_by(desc(Alert.created_at), desc(Alert.id))
+            .limit(limit)
+        )
+    ).all()
+
+    if rows:
+        alerts = _ALERT_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+        total = rows[0].total
+        unresolved_count = rows[0].unresolved_count
+    else:
+        # Empty page - verify the project exists and get the counts directly
+        counts = (
+            await db.execute(
+                select(
+                    select(Project.id).where(Project.id == project_id).exists(),
+                    total_count_query,
+                    unresolved_count_query,
+                )
+            )
+        ).one()
+        project_exists, total, unresolved_count = counts
+
+        if not project_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+
+        alerts = []
+
+    next_cursor = None
+    if len(alerts) == limit:
+        next_cursor = {"created_before": alerts[-1].created_at, "cursor_id": alerts[-1].id}
+
+    payload = AlertListResponse(
+        alerts=alerts,
+        total=total,
+        unresolved_count=unresolved_count or 0,
+        next_cursor=next_cursor
+    ).model_dump_json()
+    await CacheService.set_alert_list(redis_conn, project_id, cache_params, payload)
+
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{project_id}/{alert_id}", response_model=AlertResponse)
 async def get_alert(
     project_id: UUID,
     alert_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get a specific alert by ID.
     """
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.project_id == project_id
-    ).first()
+    alert = (
+        await db.execute(
+            select(Alert).where(
+                Alert.id == alert_id,
+                Alert.project_id == project_id
+            )
+        )
+    ).scalar_one_or_none()
 
     if not alert:
         raise HTTPException(
@@ -96,19 +191,59 @@ async def get_alert(
     return alert
 
 
+@router.put("/{project_id}/resolve", response_model=AlertBulkResolveResponse)
+async def bulk_resolve_alerts(
+    project_id: UUID,
+    request: AlertBulkResolveRequest,
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
+):
+    """
+    Resolve (or unresolve) several alerts in a single UPDATE.
+
+    IDs that don't exist or belong to another project are ignored; the
+    response lists the alerts that were actually updated.
+    """
+    updated_ids = (
+        await db.execute(
+            update(Alert)
+            .where(
+                Alert.project_id == project_id,
+                Alert.id.in_(request.alert_ids)
+            )
+            .values(resolved=request.resolved)
+            .returning(Alert.id)
+        )
+    ).scalars().all()
+    await db.commit()
+
+    if updated_ids:
+        await CacheService.invalidate_alerts(redis_conn, project_id)
+
+    return AlertBulkResolveResponse(updated_ids=updated_ids)
+
+
 @router.put("/{project_id}/{alert_id}/resolve", response_model=AlertResponse)
 async def resolve_alert(
     project_id: UUID,
     alert_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Mark an alert as resolved.
     """
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.project_id == project_id
-    ).first()
+    alert = (
+        await db.execute(
+            update(Alert)
+            .where(
+                Alert.id == alert_id,
+                Alert.project_id == project_id
+            )
+            .values(resolved=True)
+            .returning(Alert)
+        )
+    ).scalar_one_or_none()
 
     if not alert:
         raise HTTPException(
@@ -116,9 +251,8 @@ async def resolve_alert(
             detail="Alert not found"
         )
 
-    alert.resolved = True
-    db.commit()
-    db.refresh(alert)
+    await db.commit()
+    await CacheService.invalidate_alerts(redis_conn, project_id)
 
     return alert
 
@@ -127,15 +261,23 @@ async def resolve_alert(
 async def unresolve_alert(
     project_id: UUID,
     alert_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Mark an alert as unresolved.
     """
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.project_id == project_id
-    ).first()
+    alert = (
+        await db.execute(
+            update(Alert)
+            .where(
+                Alert.id == alert_id,
+                Alert.project_id == project_id
+            )
+            .values(resolved=False)
+            .returning(Alert)
+        )
+    ).scalar_one_or_none()
 
     if not alert:
         raise HTTPException(
@@ -143,9 +285,8 @@ async def unresolve_alert(
             detail="Alert not found"
         )
 
-    alert.resolved = False
-    db.commit()
-    db.refresh(alert)
+    await db.commit()
+    await CacheService.invalidate_alerts(redis_conn, project_id)
 
     return alert
 
@@ -154,23 +295,30 @@ async def unresolve_alert(
 async def delete_alert(
     project_id: UUID,
     alert_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis)
 ):
     """
     Delete an alert.
     """
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.project_id == project_id
-    ).first()
+    deleted_id = (
+        await db.execute(
+            delete(Alert)
+            .where(
+                Alert.id == alert_id,
+                Alert.project_id == project_id
+            )
+            .returning(Alert.id)
+        )
+    ).scalar_one_or_none()
 
-    if not alert:
+    if not deleted_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Alert not found"
         )
 
-    db.delete(alert)
-    db.commit()
+    await db.commit()
+    await CacheService.invalidate_alerts(redis_conn, project_id)
 
     return None
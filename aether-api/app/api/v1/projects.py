@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, strict_loading_options
 from app.models import Project
 from pydantic import BaseModel
 
@@ -33,14 +34,16 @@ class ProjectResponse(BaseModel):
 
 
 @router.get("/", response_model=List[ProjectResponse])
-async def list_projects(db: Session = Depends(get_db)):
+async def list_projects(db: AsyncSession = Depends(get_db)):
     """List all projects (will add auth filtering later)."""
-    projects = db.query(Project).all()
+    projects = (
+        await db.execute(select(Project).options(*strict_loading_options()))
+    ).scalars().all()
     return projects
 
 
 @router.post("/", response_model=ProjectResponse, status_code=201)
-async def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
+async def create_project(project: ProjectCreate, db: AsyncSession = Depends(get_db)):
     """Create a new project (will add org_id from auth later)."""
     # TODO: Get org_id from authenticated user
     # For now, this is a placeholder
@@ -1,35 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from datetime import datetime
-import json
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+from decimal import Decimal
+import orjson
 import uuid
+import redis.asyncio as redis
 
 from app.core.database import get_db
+from app.core.evaluation_queue import enqueue_evaluation
 from app.core.redis_client import get_redis
 from app.models import RAGTrace
-from app.schemas.trace import TraceCreate, TraceIngestResponse
-import redis.asyncio as redis
+from app.services.latency_sketch_service import LatencySketchService
+from app.schemas.trace import (
+    TraceCreate,
+    TraceBulkCreate,
+    TraceResponse,
+    TraceIngestResponse,
+    TraceBulkIngestResponse,
+)
 
 router = APIRouter()
 
+# Column order for COPY into rag_traces
+TRACE_COPY_COLUMNS = [
+    "id",
+    "project_id",
+    "query",
+    "response",
+    "contexts",
+    "trace_metadata",
+    "token_count",
+    "latency_ms",
+    "cost_usd",
+    "created_at",
+]
+
 
-async def queue_evaluation(trace_id: str, redis_conn: redis.Redis):
+def queue_evaluation(trace_id: str):
     """Queue a trace for evaluation."""
     job_data = {
         "job_id": str(uuid.uuid4()),
         "trace_id": trace_id,
         "status": "queued",
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
     }
-    # Push to Redis list (simple queue)
-    await redis_conn.lpush("evaluation_queue", json.dumps(job_data))
+    # Buffered and added to the Redis stream in batches
+    enqueue_evaluation(job_data)
 
 
 @router.post("/", response_model=TraceIngestResponse, status_code=202)
 async def ingest_trace(
     trace: TraceCreate,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     redis_conn: redis.Redis = Depends(get_redis),
 ):
     """
@@ -43,20 +66,28 @@ async def ingest_trace(
             project_id=trace.project_id,
             query=trace.query,
             response=trace.response,
-            contexts=[ctx.model_dump() for ctx in trace.contexts] if trace.contexts else None,
+            contexts=trace.model_dump(include={"contexts"})["contexts"] if trace.contexts else None,
             trace_metadata=trace.metadata,
             token_count=trace.token_count,
             latency_ms=trace.latency_ms,
             cost_usd=trace.cost_usd,
-            created_at=trace.timestamp or datetime.utcnow(),
         )
+        if trace.timestamp:
+            db_trace.created_at = trace.timestamp
 
         db.add(db_trace)
-        db.commit()
-        db.refresh(db_trace)
+        await db.commit()
+        await db.refresh(db_trace)
 
         # Queue for evaluation (async)
-        background_tasks.add_task(queue_evaluation, str(db_trace.id), redis_conn)
+        queue_evaluation(str(db_trace.id))
+
+        # Feed the latency sketch read by the P95 alert check as soon as the
+        # trace lands, so it counts traces the evaluator hasn't reached yet
+        if db_trace.latency_ms is not None:
+            await LatencySketchService.record_many(
+                redis_conn, [(db_trace.project_id, db_trace.latency_ms, db_trace.created_at)]
+            )
 
         return TraceIngestResponse(
             trace_id=db_trace.id,
@@ -64,14 +95,78 @@ async def ingest_trace(
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to ingest trace: {str(e)}")
 
 
-@router.get("/{trace_id}")
-async def get_trace(trace_id: uuid.UUID, db: Session = Depends(get_db)):
+def _trace_copy_record(trace_id: uuid.UUID, trace: TraceCreate, now: datetime) -> tuple:
+    """Build a COPY row for a trace, encoding values the way asyncpg expects."""
+    return (
+        trace_id,
+        trace.project_id,
+        trace.query,
+        trace.response,
+        orjson.dumps(trace.model_dump(include={"contexts"})["contexts"]).decode() if trace.contexts else None,
+        orjson.dumps(trace.metadata).decode() if trace.metadata is not None else None,
+        trace.token_count,
+        trace.latency_ms,
+        Decimal(str(trace.cost_usd)) if trace.cost_usd is not None else None,
+        trace.timestamp or now,
+    )
+
+
+@router.post("/bulk", response_model=TraceBulkIngestResponse, status_code=202)
+async def ingest_traces_bulk(
+    batch: TraceBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    redis_conn: redis.Redis = Depends(get_redis),
+):
+    """
+    Ingest a batch of RAG traces for evaluation.
+
+    Rows are streamed into rag_traces with a single binary COPY instead of
+    one INSERT per trace. Returns 202 Accepted - traces are queued for async processing.
+    """
+    now = datetime.now(timezone.utc)
+    trace_ids = [uuid.uuid4() for _ in batch.traces]
+
+    try:
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            RAGTrace.__tablename__,
+            records=[
+                _trace_copy_record(trace_id, trace, now)
+                for trace_id, trace in zip(trace_ids, batch.traces)
+            ],
+            columns=TRACE_COPY_COLUMNS,
+        )
+        await db.commit()
+
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to ingest traces: {str(e)}")
+
+    # Queue for evaluation (coalesced into pipelined XADDs)
+    for trace_id in trace_ids:
+        queue_evaluation(str(trace_id))
+
+    # Feed the latency sketch, one pipelined round trip for the whole batch
+    await LatencySketchService.record_many(redis_conn, (
+        (trace.project_id, trace.latency_ms, trace.timestamp or now)
+        for trace in batch.traces
+        if trace.latency_ms is not None
+    ))
+
+    return TraceBulkIngestResponse(trace_ids=trace_ids, status="queued")
+
+
+@router.get("/{trace_id}", response_model=TraceResponse)
+async def get_trace(trace_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Get a specific trace by ID."""
-    trace = db.query(RAGTrace).filter(RAGTrace.id == trace_id).first()
+    trace = (
+        await db.execute(select(RAGTrace).where(RAGTrace.id == trace_id))
+    ).scalar_one_or_none()
     if not trace:
         raise HTTPException(status_code=404, detail="Trace not found")
     return trace
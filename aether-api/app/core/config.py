@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from sqlalchemy.engine import make_url
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +16,7 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 64
 
     # API Security
     api_secret_key: str
@@ -25,21 +27,47 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = None
     anthropic_api_key: Optional[str] = None
 
+    # Faithfulness scoring: "llm" asks one judge prompt per trace (one OpenAI
+    # call), "ragas" runs the RAGAS metric (several calls, gpt-3.5-turbo)
+    faithfulness_judge: Literal["llm", "ragas"] = "llm"
+    faithfulness_model: str = "gpt-4o-mini"
+
+    # OpenAI account limits the evaluation worker paces faithfulness calls under
+    openai_rpm_limit: int = 3500
+    openai_tpm_limit: int = 90000
+
     # Environment
     environment: str = "development"
 
+    # Evaluation worker log level; per-trace detail is logged at DEBUG
+    worker_log_level: str = "INFO"
+
+    # Batches the evaluation worker processes at once (one DB session each)
+    eval_concurrency: int = 4
+
     # Rate Limiting
     rate_limit_per_minute: int = 60
 
-    # CORS
-    cors_origins: list[str] = [
-        "http://localhost:3000",
-        "http://localhost:3001",
-    ]
+    # CORS - origins are matched with one precompiled regex; cors_origins is
+    # for the odd exact origin that doesn't fit the pattern
+    cors_origin_regex: Optional[str] = r"https?://localhost:(3000|3001)"
+    cors_origins: list[str] = []
 
     @property
     def is_production(self) -> bool:
         return self.environment == "production"
 
+    @property
+    def sync_database_url(self) -> str:
+        """Database URL rewritten to use the psycopg (3) driver."""
+        url = make_url(self.database_url).set(drivername="postgresql+psycopg")
+        return url.render_as_string(hide_password=False)
+
+    @property
+    def async_database_url(self) -> str:
+        """Database URL rewritten to use the asyncpg driver."""
+        url = make_url(self.database_url).set(drivername="postgresql+asyncpg")
+        return url.render_as_string(hide_password=False)
+
 
 settings = Settings()
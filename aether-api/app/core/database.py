@@ -1,11 +1,14 @@
+import orjson
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, raiseload
 from app.core.config import settings
 
-# Create database engine
+# Create database engine (sync, psycopg 3 - used by scripts). psycopg prepares
+# statements server-side once they've run prepare_threshold (5) times.
 engine = create_engine(
-    settings.database_url,
+    settings.sync_database_url,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
@@ -14,14 +17,43 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async database engine (asyncpg - used by the API and the worker)
+async_engine = create_async_engine(
+    settings.async_database_url,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=3600,  # Recycle before Postgres/pgbouncer idle timeouts drop the connection
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency to get database session."""
-    db = SessionLocal()
-    try:
+async def get_db():
+    """Dependency to get async database session."""
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def strict_loading_options() -> list:
+    """
+    Loader options for list queries.
+
+    Outside production, any relationship that isn't eagerly loaded raises on access
+    instead of silently issuing one SELECT per row.
+    """
+    if settings.is_production:
+        return []
+    return [raiseload("*")]
@@ -0,0 +1,246 @@
+import asyncio
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+EVALUATION_STREAM = "evaluation_stream"
+CONSUMER_GROUP = "evaluators"
+
+# Approximate cap on stream length so acknowledged entries don't grow memory forever
+STREAM_MAXLEN = 1_000_000
+
+# Max jobs coalesced into a single pipelined XADD round trip
+MAX_BATCH_SIZE = 500
+
+# Jobs pending this long are presumed abandoned and may be claimed by another
+# consumer; consumers touch the jobs they're still working on well within it
+STALE_JOB_IDLE_MS = 60_000
+
+# Jobs delivered this many times are presumed poison (e.g. they take the worker
+# down every time) and parked in the dead-letter stream instead of retried
+MAX_JOB_DELIVERIES = 5
+DEAD_LETTER_STREAM = f"{EVALUATION_STREAM}:dead"
+DEAD_LETTER_MAXLEN = 100_000
+
+# In-process buffer drained by the flusher task
+_pending: Optional[asyncio.Queue] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+
+def enqueue_evaluation(job_data: dict[str, str]) -> None:
+    """Buffer an evaluation job; the flusher adds it to the Redis stream."""
+    global _pending
+    if _pending is None:
+        _pending = asyncio.Queue()
+    _pending.put_nowait(job_data)
+
+
+def _drain(first: dict[str, str]) -> list[dict[str, str]]:
+    """Collect everything buffered so far, up to MAX_BATCH_SIZE."""
+    batch = [first]
+    while len(batch) < MAX_BATCH_SIZE:
+        try:
+            batch.append(_pending.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
+
+
+async def _add_jobs(redis_conn: redis.Redis, batch: list[dict[str, str]]) -> None:
+    """XADD a batch of jobs in one pipelined round trip."""
+    async with redis_conn.pipeline(transaction=False) as pipe:
+        for job_data in batch:
+            pipe.xadd(EVALUATION_STREAM, job_data, maxlen=STREAM_MAXLEN, approximate=True)
+        await pipe.execute()
+
+
+async def _flush_loop() -> None:
+    """
+    Add buffered jobs to the stream, one pipelined round trip per batch.
+
+    Jobs that arrive while a write is in flight are coalesced into the next one,
+    so bursts batch up without adding latency to a lone job.
+    """
+    redis_conn = await get_redis()
+    while True:
+        batch = _drain(await _pending.get())
+        while True:
+            try:
+                await _add_jobs(redis_conn, batch)
+                break
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to add {len(batch)} evaluation jobs, retrying: {e}")
+                await asyncio.sleep(1)
+
+
+async def start_evaluation_queue() -> None:
+    """Start the background flusher."""
+    global _pending, _flusher_task
+    if _pending is None:
+        _pending = asyncio.Queue()
+    if _flusher_task is None:
+        _flusher_task = asyncio.create_task(_flush_loop())
+
+
+async def stop_evaluation_queue() -> None:
+    """Stop the flusher and add any jobs still buffered."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        try:
+            await _flusher_task
+        except asyncio.CancelledError:
+            pass
+        _flusher_task = None
+
+    if _pending is not None and not _pending.empty():
+        redis_conn = await get_redis()
+        while not _pending.empty():
+            await _add_jobs(redis_conn, _drain(_pending.get_nowait()))
+
+
+async def ensure_consumer_group(redis_conn: redis.Redis) -> None:
+    """Create the evaluator consumer group (and the stream) if missing."""
+    try:
+        await redis_conn.xgroup_create(EVALUATION_STREAM, CONSUMER_GROUP, id="0", mkstream=True)
+    except redis.ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+
+def _decode_entries(entries: list) -> list[tuple[bytes, dict[str, str]]]:
+    return [
+        (entry_id, {key.decode(): value.decode() for key, value in fields.items()})
+        for entry_id, fields in entries
+        if fields
+    ]
+
+
+async def read_evaluation_jobs(
+    redis_conn: redis.Redis,
+    consumer: str,
+    count: int = MAX_BATCH_SIZE,
+    block_ms: int = 5000
+) -> list[tuple[bytes, dict[str, str]]]:
+    """
+    Read new jobs for this consumer, blocking until some arrive or block_ms passes.
+
+    Jobs stay in the group's pending list until acknowledged, so a worker that
+    dies mid-batch doesn't lose them.
+
+    Args:
+        redis_conn: Redis client
+        consumer: Consumer name, unique per worker process
+        count: Max jobs returned per call
+        block_ms: Max time to block waiting for jobs
+
+    Returns:
+        List of (entry_id, job) pairs
+    """
+    response = await redis_conn.xreadgroup(
+        CONSUMER_GROUP, consumer, {EVALUATION_STREAM: ">"}, count=count, block=block_ms
+    )
+    if not response:
+        return []
+    _, entries = response[0]
+    return _decode_entries(entries)
+
+
+async def claim_stale_jobs(
+    redis_conn: redis.Redis,
+    consumer: str,
+    min_idle_ms: int = STALE_JOB_IDLE_MS,
+    count: int = MAX_BATCH_SIZE
+) -> list[tuple[bytes, dict[str, str]]]:
+    """
+    Take over jobs left unacknowledged by dead consumers.
+
+    Jobs already delivered more than MAX_JOB_DELIVERIES times are moved to the
+    dead-letter stream instead of returned, so a job that keeps failing isn't
+    retried forever.
+
+    Args:
+        redis_conn: Redis client
+        consumer: Consumer name to assign the jobs to
+        min_idle_ms: Only claim jobs pending for at least this long
+        count: Max jobs claimed per call
+
+    Returns:
+        List of (entry_id, job) pairs
+    """
+    _, entries, *_ = await redis_conn.xautoclaim(
+        EVALUATION_STREAM, CONSUMER_GROUP, consumer, min_idle_time=min_idle_ms, count=count
+    )
+    jobs = _decode_entries(entries)
+    if not jobs:
+        return jobs
+
+    deliveries = await _delivery_counts(redis_conn, [entry_id for entry_id, _ in jobs])
+    dead = [(entry_id, job, n) for (entry_id, job), n in zip(jobs, deliveries) if n > MAX_JOB_DELIVERIES]
+    if dead:
+        await _dead_letter_jobs(redis_conn, dead)
+        logger.warning(
+            f"☠️  Moved {len(dead)} evaluation jobs delivered over {MAX_JOB_DELIVERIES} times to {DEAD_LETTER_STREAM}"
+        )
+    return [job for job, n in zip(jobs, deliveries) if n <= MAX_JOB_DELIVERIES]
+
+
+async def _delivery_counts(redis_conn: redis.Redis, entry_ids: list[bytes]) -> list[int]:
+    """Look up how many times each pending job has been delivered, in one round trip."""
+    async with redis_conn.pipeline(transaction=False) as pipe:
+        for entry_id in entry_ids:
+            pipe.xpending_range(EVALUATION_STREAM, CONSUMER_GROUP, min=entry_id, max=entry_id, count=1)
+        pending = await pipe.execute()
+    return [entries[0]["times_delivered"] if entries else 0 for entries in pending]
+
+
+async def _dead_letter_jobs(redis_conn: redis.Redis, dead: list[tuple[bytes, dict[str, str], int]]) -> None:
+    """Copy (entry_id, job, deliveries) triples to the dead-letter stream and drop them from the queue."""
+    entry_ids = [entry_id for entry_id, _, _ in dead]
+    async with redis_conn.pipeline(transaction=False) as pipe:
+        for entry_id, job, deliveries in dead:
+            pipe.xadd(
+                DEAD_LETTER_STREAM,
+                {**job, "entry_id": entry_id, "deliveries": deliveries},
+                maxlen=DEAD_LETTER_MAXLEN,
+                approximate=True
+            )
+        pipe.xack(EVALUATION_STREAM, CONSUMER_GROUP, *entry_ids)
+        pipe.xdel(EVALUATION_STREAM, *entry_ids)
+        await pipe.execute()
+
+
+async def touch_evaluation_jobs(redis_conn: redis.Redis, consumer: str, *entry_ids: bytes) -> None:
+    """
+    Reset the idle time of jobs this consumer is still working on.
+
+    XCLAIMs them to the same consumer (JUSTID, so the delivery count isn't
+    bumped), which keeps claim_stale_jobs from handing a slow batch to
+    another consumer while it's in flight.
+
+    Args:
+        redis_conn: Redis client
+        consumer: Consumer name that owns the jobs
+        entry_ids: Stream entry IDs to touch
+    """
+    if not entry_ids:
+        return
+    await redis_conn.xclaim(
+        EVALUATION_STREAM, CONSUMER_GROUP, consumer,
+        min_idle_time=0, message_ids=list(entry_ids), justid=True
+    )
+
+
+async def ack_evaluation_jobs(redis_conn: redis.Redis, *entry_ids: bytes) -> None:
+    """Acknowledge handled jobs and drop them from the stream."""
+    if not entry_ids:
+        return
+    async with redis_conn.pipeline(transaction=False) as pipe:
+        pipe.xack(EVALUATION_STREAM, CONSUMER_GROUP, *entry_ids)
+        pipe.xdel(EVALUATION_STREAM, *entry_ids)
+        await pipe.execute()
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async rate limiter for APIs that cap both requests and tokens per minute.
+
+    Both buckets refill continuously. A caller that would overdraw either one
+    still reserves its share straight away (the balance goes negative) and then
+    sleeps until the debt is repaid, so callers are paced in arrival order and
+    a request larger than the bucket still goes through instead of waiting forever.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, requests: int = 1, tokens: int = 0) -> None:
+        """
+        Wait until the given number of requests and tokens may be spent.
+
+        Args:
+            requests: Number of API requests about to be made
+            tokens: Estimated tokens those requests will use
+        """
+        async with self._lock:
+            now = time.monotonic()
+            elapsed_minutes = (now - self._updated) / 60
+            self._updated = now
+
+            self._requests = min(
+                self.requests_per_minute,
+                self._requests + elapsed_minutes * self.requests_per_minute
+            )
+            self._tokens = min(
+                self.tokens_per_minute,
+                self._tokens + elapsed_minutes * self.tokens_per_minute
+            )
+
+            self._requests -= requests
+            self._tokens -= tokens
+
+            wait = max(
+                -self._requests * 60 / self.requests_per_minute,
+                -self._tokens * 60 / self.tokens_per_minute,
+                0.0
+            )
+
+        if wait > 0:
+            await asyncio.sleep(wait)
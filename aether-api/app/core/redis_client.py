@@ -7,13 +7,21 @@ redis_client: Optional[redis.Redis] = None
 
 
 async def get_redis() -> redis.Redis:
-    """Get Redis client instance."""
+    """
+    Get Redis client instance.
+
+    Responses are left as bytes: queue jobs and cached payloads are JSON that
+    goes straight to orjson or the HTTP response, so decoding to str is wasted work.
+    """
     global redis_client
     if redis_client is None:
-        redis_client = await redis.from_url(
+        redis_client = redis.from_url(
             settings.redis_url,
             encoding="utf-8",
-            decode_responses=True,
+            decode_responses=False,
+            max_connections=settings.redis_max_connections,
+            socket_keepalive=True,
+            health_check_interval=30,
         )
     return redis_client
 
@@ -1,9 +1,11 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.redis_client import get_redis, close_redis
+from app.core.evaluation_queue import start_evaluation_queue, stop_evaluation_queue
 from app.api.v1 import health, traces, projects, auth, alerts, alert_config
 
 
@@ -12,8 +14,10 @@ async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
     # Startup
     await get_redis()
+    await start_evaluation_queue()
     yield
     # Shutdown
+    await stop_evaluation_queue()
     await close_redis()
 
 
@@ -22,12 +26,14 @@ app = FastAPI(
     description="Production RAG Observability Platform",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
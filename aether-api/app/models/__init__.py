@@ -5,6 +5,7 @@ from app.models.evaluation import Evaluation
 from app.models.alert import Alert, AlertType, Severity
 from app.models.alert_config import AlertConfig
 from app.models.user import User
+from app.models.project_hourly_rollup import ProjectHourlyRollup
 
 __all__ = [
     "Organization",
@@ -18,4 +19,5 @@ __all__ = [
     "Severity",
     "AlertConfig",
     "User",
+    "ProjectHourlyRollup",
 ]
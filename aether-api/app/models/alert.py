@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Enum, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import enum
@@ -33,12 +32,50 @@ class Alert(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
-    alert_type = Column(Enum(AlertType), nullable=False)
-    severity = Column(Enum(Severity), nullable=False)
+    # Stored as VARCHAR + CHECK rather than a Postgres ENUM type: plain text
+    # comparisons in filters, and new values don't need ALTER TYPE.
+    alert_type = Column(
+        Enum(
+            AlertType,
+            name="ck_alerts_alert_type",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            values_callable=lambda e: [member.value for member in e],
+        ),
+        nullable=False,
+    )
+    severity = Column(
+        Enum(
+            Severity,
+            name="ck_alerts_severity",
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            values_callable=lambda e: [member.value for member in e],
+        ),
+        nullable=False,
+    )
     message = Column(String, nullable=False)
     alert_metadata = Column(JSONB)
     resolved = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="alerts")
+
+    # Indexes for common queries
+    __table_args__ = (
+        # Matches the alert list ordering so keyset pages are an index range scan;
+        # the filter columns are included so counts can use an index-only scan
+        Index(
+            "idx_alerts_project_created_id",
+            "project_id", created_at.desc(), id.desc(),
+            postgresql_include=["alert_type", "severity", "resolved"],
+        ),
+        # Serves the filtered variants of the alert list
+        Index(
+            "idx_alerts_project_filters",
+            "project_id", alert_type, severity, resolved, created_at.desc(),
+        ),
+    )
@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Float, Integer, Boolean, DateTime, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -23,6 +22,11 @@ class AlertConfig(Base):
     hallucination_threshold = Column(Float, default=0.5, nullable=False)  # Alert if faithfulness < this
     hallucination_alerts_enabled = Column(Boolean, default=True, nullable=False)
 
+    # Skip the (LLM-based) faithfulness check for well-grounded answers: token
+    # overlap at least this high (None = never skip) and at least this many words
+    faithfulness_skip_overlap = Column(Float, default=0.9, nullable=True)
+    faithfulness_skip_min_words = Column(Integer, default=20, nullable=False)
+
     # Cost Spike Thresholds
     daily_cost_budget_usd = Column(Float, nullable=True)  # Alert if daily cost exceeds this
     cost_spike_alerts_enabled = Column(Boolean, default=False, nullable=False)
@@ -32,8 +36,8 @@ class AlertConfig(Base):
     latency_alerts_enabled = Column(Boolean, default=False, nullable=False)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="alert_config")
@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, Boolean, DateTime, ForeignKey, Numeric, Index
+from sqlalchemy import Column, Boolean, DateTime, ForeignKey, Numeric, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -34,9 +33,18 @@ class Evaluation(Base):
 
     # Metadata
     evaluation_cost_usd = Column(Numeric(10, 6))  # Cost of running evaluation
-    evaluated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    evaluated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     trace = relationship("RAGTrace", back_populates="evaluation")
 
-    __table_args__ = (Index("idx_trace", "trace_id"),)
+    __table_args__ = (
+        # Lets the hourly roll-up join evaluations to traces without heap fetches
+        Index(
+            "idx_evaluations_trace_rollup",
+            "trace_id",
+            postgresql_include=["evaluation_cost_usd", "hallucination_detected"],
+        ),
+        # Finds evaluations written since the roll-up's last refresh
+        Index("idx_evaluations_evaluated_at", "evaluated_at", postgresql_include=["trace_id"]),
+    )
@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Enum
+from sqlalchemy import Column, String, DateTime, Enum, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -26,7 +25,7 @@ class Organization(Base):
     name = Column(String, nullable=False)
     plan = Column(Enum(PlanType), nullable=False, default=PlanType.FREE)
     api_key = Column(String, unique=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     projects = relationship("Project", back_populates="organization", cascade="all, delete-orphan")
@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -28,10 +27,17 @@ class Project(Base):
     environment = Column(
         Enum(EnvironmentType), nullable=False, default=EnvironmentType.DEVELOPMENT
     )
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     organization = relationship("Organization", back_populates="projects")
     traces = relationship("RAGTrace", back_populates="project", cascade="all, delete-orphan")
     alerts = relationship("Alert", back_populates="project", cascade="all, delete-orphan")
-    alert_config = relationship("AlertConfig", back_populates="project", uselist=False, cascade="all, delete-orphan")
+    # 1:1 and read alongside the project on every evaluation, so load it in the same SELECT
+    alert_config = relationship(
+        "AlertConfig",
+        back_populates="project",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="joined",
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class ProjectHourlyRollup(Base):
+    """Hourly roll-up of trace/evaluation counts and cost per project, used by alert checks."""
+
+    __tablename__ = "project_hourly_rollup"
+
+    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), primary_key=True)
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    traces = Column(Integer, nullable=False, default=0)
+    cost_usd = Column(Numeric(12, 6), nullable=False, default=0)
+    hallucinations = Column(Integer, nullable=False, default=0)
+    evaluations = Column(Integer, nullable=False, default=0)
+    # When the bucket was last recomputed; the latest value is the refresh watermark
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
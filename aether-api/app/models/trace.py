@@ -1,6 +1,5 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Numeric, Text, Index
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Numeric, Text, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -21,7 +20,7 @@ class RAGTrace(Base):
     token_count = Column(Integer)
     latency_ms = Column(Integer)
     cost_usd = Column(Numeric(10, 6))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="traces")
@@ -31,6 +30,8 @@ class RAGTrace(Base):
 
     # Indexes for common queries
     __table_args__ = (
-        Index("idx_project_created", "project_id", "created_at"),
-        Index("idx_created_at", "created_at"),
+        # latency_ms is included so the P95 query is an index-only range scan
+        Index("idx_project_created", "project_id", "created_at", postgresql_include=["latency_ms"]),
+        # project_id/id are included so the hourly roll-up's range scan is index-only
+        Index("idx_created_at", "created_at", postgresql_include=["project_id", "id"]),
     )
@@ -2,7 +2,7 @@
 Pydantic schemas for Alerts
 """
 from typing import Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 
@@ -24,8 +24,26 @@ class AlertResponse(BaseModel):
         from_attributes = True
 
 
+class AlertCursor(BaseModel):
+    """Keyset cursor pointing at the last alert of a page."""
+    created_before: datetime
+    cursor_id: UUID
+
+
 class AlertListResponse(BaseModel):
     """Schema for alert list response."""
     alerts: list[AlertResponse]
     total: int
     unresolved_count: int
+    next_cursor: Optional[AlertCursor] = None
+
+
+class AlertBulkResolveRequest(BaseModel):
+    """Schema for resolving or unresolving several alerts at once."""
+    alert_ids: list[UUID] = Field(..., min_length=1, max_length=1000)
+    resolved: bool = True
+
+
+class AlertBulkResolveResponse(BaseModel):
+    """Schema for bulk resolve response."""
+    updated_ids: list[UUID]
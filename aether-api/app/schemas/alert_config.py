@@ -13,6 +13,8 @@ class AlertConfigBase(BaseModel):
     slack_enabled: bool = False
     hallucination_threshold: float = Field(default=0.5, ge=0.0, le=1.0)
     hallucination_alerts_enabled: bool = True
+    faithfulness_skip_overlap: Optional[float] = Field(default=0.9, ge=0.0, le=1.0)
+    faithfulness_skip_min_words: int = Field(default=20, ge=0)
     daily_cost_budget_usd: Optional[float] = Field(default=None, ge=0.0)
     cost_spike_alerts_enabled: bool = False
     latency_p95_threshold_ms: Optional[int] = Field(default=None, ge=0)
@@ -30,6 +32,8 @@ class AlertConfigUpdate(BaseModel):
     slack_enabled: Optional[bool] = None
     hallucination_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0)
     hallucination_alerts_enabled: Optional[bool] = None
+    faithfulness_skip_overlap: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    faithfulness_skip_min_words: Optional[int] = Field(default=None, ge=0)
     daily_cost_budget_usd: Optional[float] = Field(default=None, ge=0.0)
     cost_spike_alerts_enabled: Optional[bool] = None
     latency_p95_threshold_ms: Optional[int] = Field(default=None, ge=0)
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 from typing import Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 
 
@@ -26,6 +26,20 @@ class TraceCreate(BaseModel):
     cost_usd: Optional[float] = None
     timestamp: Optional[datetime] = None
 
+    @field_validator("timestamp")
+    @classmethod
+    def assume_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        """Treat naive timestamps as UTC."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
+
+
+class TraceBulkCreate(BaseModel):
+    """Schema for ingesting a batch of traces."""
+
+    traces: list[TraceCreate] = Field(..., min_length=1, max_length=5000)
+
 
 class TraceResponse(BaseModel):
     """Schema for trace response."""
@@ -35,7 +49,9 @@ class TraceResponse(BaseModel):
     query: str
     response: str
     contexts: Optional[list[dict[str, Any]]] = None
-    metadata: Optional[dict[str, Any]] = None
+    metadata: Optional[dict[str, Any]] = Field(
+        None, validation_alias=AliasChoices("trace_metadata", "metadata")
+    )
     token_count: Optional[int] = None
     latency_ms: Optional[int] = None
     cost_usd: Optional[float] = None
@@ -50,3 +66,10 @@ class TraceIngestResponse(BaseModel):
 
     trace_id: UUID
     status: str = "queued"
+
+
+class TraceBulkIngestResponse(BaseModel):
+    """Response after ingesting a batch of traces."""
+
+    trace_ids: list[UUID]
+    status: str = "queued"
@@ -0,0 +1,189 @@
+"""
+Cache Service
+
+Caches hot API responses in Redis and invalidates them on mutation.
+"""
+from typing import Dict, List, Optional
+from uuid import UUID
+import redis.asyncio as redis
+
+
+class CacheService:
+    """Service for caching serialized API responses in Redis."""
+
+    ALERT_LIST_TTL_SECONDS = 15
+    # Short so a GET that misses, reads the DB and caches just as a mutation
+    # commits can't serve the old config for long
+    ALERT_CONFIG_TTL_SECONDS = 15
+    FAITHFULNESS_TTL_SECONDS = 7 * 86400
+
+    @staticmethod
+    def _alert_list_key(project_id: UUID) -> str:
+        return f"alerts:{project_id}"
+
+    @staticmethod
+    async def get_alert_list(
+        redis_conn: redis.Redis,
+        project_id: UUID,
+        params: str
+    ) -> Optional[bytes]:
+        """
+        Get a cached alert list response.
+
+        All pages for a project live in one hash (field = query params) so a
+        single DEL invalidates every cached page.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+            params: Serialized query parameters identifying the page
+
+        Returns:
+            Cached JSON response, or None on miss
+        """
+        try:
+            return await redis_conn.hget(CacheService._alert_list_key(project_id), params)
+        except redis.RedisError:
+            return None
+
+    @staticmethod
+    async def set_alert_list(
+        redis_conn: redis.Redis,
+        project_id: UUID,
+        params: str,
+        payload: str
+    ) -> None:
+        """
+        Cache an alert list response.
+
+        The TTL is only set when the hash is created, so no page can outlive
+        ALERT_LIST_TTL_SECONDS even if other pages keep being written.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+            params: Serialized query parameters identifying the page
+            payload: JSON response body
+        """
+        key = CacheService._alert_list_key(project_id)
+        try:
+            async with redis_conn.pipeline(transaction=False) as pipe:
+                pipe.hset(key, params, payload)
+                pipe.expire(key, CacheService.ALERT_LIST_TTL_SECONDS, nx=True)
+                await pipe.execute()
+        except redis.RedisError:
+            pass
+
+    @staticmethod
+    async def invalidate_alerts(redis_conn: redis.Redis, project_id: UUID) -> None:
+        """
+        Drop all cached alert list pages for a project.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+        """
+        try:
+            await redis_conn.delete(CacheService._alert_list_key(project_id))
+        except redis.RedisError:
+            pass
+
+    @staticmethod
+    def _alert_config_key(project_id: UUID) -> str:
+        return f"alertconfig:{project_id}"
+
+    @staticmethod
+    async def get_alert_config(redis_conn: redis.Redis, project_id: UUID) -> Optional[bytes]:
+        """
+        Get a cached alert configuration response.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+
+        Returns:
+            Cached JSON response, or None on miss
+        """
+        try:
+            return await redis_conn.get(CacheService._alert_config_key(project_id))
+        except redis.RedisError:
+            return None
+
+    @staticmethod
+    async def set_alert_config(redis_conn: redis.Redis, project_id: UUID, payload: str) -> None:
+        """
+        Cache an alert configuration response.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+            payload: JSON response body
+        """
+        try:
+            await redis_conn.setex(
+                CacheService._alert_config_key(project_id),
+                CacheService.ALERT_CONFIG_TTL_SECONDS,
+                payload
+            )
+        except redis.RedisError:
+            pass
+
+    @staticmethod
+    async def invalidate_alert_config(redis_conn: redis.Redis, project_id: UUID) -> None:
+        """
+        Drop the cached alert configuration for a project.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+        """
+        try:
+            await redis_conn.delete(CacheService._alert_config_key(project_id))
+        except redis.RedisError:
+            pass
+
+    @staticmethod
+    def _faithfulness_key(digest: str) -> str:
+        return f"rageval:{digest}"
+
+    @staticmethod
+    async def get_faithfulness_many(redis_conn: redis.Redis, digests: List[str]) -> List[Optional[bytes]]:
+        """
+        Get cached faithfulness results in one MGET.
+
+        Args:
+            redis_conn: Redis client
+            digests: SHA256 of each item's evaluation inputs
+
+        Returns:
+            Cached JSON result per digest (None on miss), in the same order
+        """
+        if not digests:
+            return []
+        try:
+            return await redis_conn.mget([CacheService._faithfulness_key(digest) for digest in digests])
+        except redis.RedisError:
+            return [None] * len(digests)
+
+    @staticmethod
+    async def set_faithfulness_many(redis_conn: redis.Redis, payloads: Dict[str, bytes]) -> None:
+        """
+        Cache faithfulness results in one pipelined round trip.
+
+        Args:
+            redis_conn: Redis client
+            payloads: JSON result keyed by SHA256 of the evaluation inputs
+        """
+        if not payloads:
+            return
+        try:
+            async with redis_conn.pipeline(transaction=False) as pipe:
+                for digest, payload in payloads.items():
+                    pipe.setex(
+                        CacheService._faithfulness_key(digest),
+                        CacheService.FAITHFULNESS_TTL_SECONDS,
+                        payload
+                    )
+                await pipe.execute()
+        except redis.RedisError:
+            pass
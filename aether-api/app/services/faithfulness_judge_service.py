@@ -0,0 +1,103 @@
+"""
+Faithfulness Judge Service
+
+Scores whether an answer is grounded in its retrieved contexts with one LLM
+call, instead of RAGAS's separate statement-extraction and verification calls.
+"""
+from typing import Any, Dict, Final, List, Optional
+import orjson
+from openai import AsyncOpenAI
+
+from app.core.config import settings
+
+# USD per 1M (input, output) tokens for models the judge may run on
+_MODEL_PRICING: Final[dict[str, tuple[float, float]]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-3.5-turbo": (0.50, 1.50),
+}
+
+# Same definition RAGAS uses: the share of the answer's claims the contexts support
+_JUDGE_PROMPT: Final[str] = (
+    "You judge whether an answer produced by a retrieval-augmented system is "
+    "faithful to the retrieved contexts.\n"
+    "1. Break the answer into its individual factual claims.\n"
+    "2. For each claim, decide whether the contexts state it or directly imply it. "
+    "Use only the contexts, never outside knowledge.\n"
+    "Reply with a JSON object: "
+    '{"total_claims": <number of claims>, "supported_claims": <number supported>}'
+)
+
+# Shared client so judge calls reuse pooled connections to OpenAI
+_client: Optional[AsyncOpenAI] = None
+
+
+def _get_client() -> AsyncOpenAI:
+    """Get the shared OpenAI client, creating it on first use (reads OPENAI_API_KEY)."""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=settings.openai_api_key)
+    return _client
+
+
+async def close_judge_client() -> None:
+    """Close the shared OpenAI client."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+class FaithfulnessJudgeService:
+    """Service for scoring faithfulness with a single LLM judge call."""
+
+    @staticmethod
+    async def score(
+        query: str,
+        answer: str,
+        contexts: List[str],
+        model: str,
+        temperature: float = 0
+    ) -> Dict[str, Any]:
+        """
+        Score how faithful an answer is to its contexts.
+
+        Args:
+            query: The user's question
+            answer: The generated response
+            contexts: List of retrieved context texts
+            model: OpenAI chat model to judge with
+            temperature: Sampling temperature
+
+        Returns:
+            Dictionary with 'score' (0.0-1.0, None if the answer makes no
+            claims) and 'cost' (USD, from the reported token usage) keys
+        """
+        response = await _get_client().chat.completions.create(
+            model=model,
+            temperature=temperature,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": _JUDGE_PROMPT},
+                {
+                    "role": "user",
+                    "content": orjson.dumps(
+                        {"question": query, "answer": answer, "contexts": contexts}
+                    ).decode()
+                },
+            ],
+        )
+
+        verdict = orjson.loads(response.choices[0].message.content)
+        total = int(verdict.get("total_claims", 0))
+        supported = int(verdict.get("supported_claims", 0))
+        score = min(supported, total) / total if total > 0 else None
+
+        cost = 0.0
+        if response.usage is not None:
+            input_price, output_price = _MODEL_PRICING.get(model, _MODEL_PRICING["gpt-4o-mini"])
+            cost = (
+                response.usage.prompt_tokens * input_price
+                + response.usage.completion_tokens * output_price
+            ) / 1_000_000
+
+        return {"score": score, "cost": cost}
@@ -0,0 +1,136 @@
+"""
+Latency Sketch Service
+
+Maintains mergeable per-project latency histograms in Redis so percentile
+queries don't have to rescan traces.
+"""
+import math
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+import redis.asyncio as redis
+
+
+class LatencySketchService:
+    """
+    Service for approximate latency percentiles.
+
+    Latencies are counted into log-scale buckets (each bucket spans GAMMA x the
+    previous one, so estimates are within ~1% of the true value). Counts live in
+    one Redis hash per project per BUCKET_MINUTES window; windows are merged by
+    summing counts, so a percentile over N hours costs a handful of HGETALLs
+    regardless of trace volume.
+    """
+
+    GAMMA = 1.02
+    BUCKET_MINUTES = 5
+    RETENTION_HOURS = 48
+
+    _LOG_GAMMA = math.log(GAMMA)
+
+    @staticmethod
+    def _window_start(ts: datetime) -> int:
+        epoch = int(ts.timestamp())
+        window = LatencySketchService.BUCKET_MINUTES * 60
+        return epoch - epoch % window
+
+    @staticmethod
+    def _key(project_id: UUID, window_start: int) -> str:
+        return f"latency:sketch:{project_id}:{window_start}"
+
+    @staticmethod
+    def _bucket(latency_ms: float) -> int:
+        if latency_ms <= 1:
+            return 0
+        return math.ceil(math.log(latency_ms) / LatencySketchService._LOG_GAMMA)
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> float:
+        if bucket <= 0:
+            return 1.0
+        # Midpoint of (GAMMA^(b-1), GAMMA^b]
+        gamma = LatencySketchService.GAMMA
+        return 2 * gamma ** bucket / (gamma + 1)
+
+    @staticmethod
+    async def record_many(
+        redis_conn: redis.Redis,
+        samples: Iterable[Tuple[UUID, float, Optional[datetime]]]
+    ) -> None:
+        """
+        Count a batch of latency observations in one pipelined round trip.
+
+        Args:
+            redis_conn: Redis client
+            samples: (project_id, latency_ms, timestamp) tuples; a None
+                timestamp means now
+        """
+        now = datetime.now(timezone.utc)
+        counts: Counter = Counter()
+        for project_id, latency_ms, timestamp in samples:
+            window_start = LatencySketchService._window_start(timestamp or now)
+            key = LatencySketchService._key(project_id, window_start)
+            counts[(key, LatencySketchService._bucket(latency_ms))] += 1
+        if not counts:
+            return
+
+        try:
+            async with redis_conn.pipeline(transaction=False) as pipe:
+                for (key, bucket), count in counts.items():
+                    pipe.hincrby(key, bucket, count)
+                for key in {key for key, _ in counts}:
+                    pipe.expire(key, LatencySketchService.RETENTION_HOURS * 3600, nx=True)
+                await pipe.execute()
+        except redis.RedisError:
+            pass
+
+    @staticmethod
+    async def get_percentile(
+        redis_conn: redis.Redis,
+        project_id: UUID,
+        percentile: float,
+        hours: int = 1
+    ) -> Optional[float]:
+        """
+        Estimate a latency percentile for a project over the last N hours.
+
+        Args:
+            redis_conn: Redis client
+            project_id: Project UUID
+            percentile: Percentile as a fraction (e.g. 0.95)
+            hours: Number of hours to look back
+
+        Returns:
+            Estimated latency in milliseconds, or None if no data (or Redis is unavailable)
+        """
+        now = datetime.now(timezone.utc)
+        first = LatencySketchService._window_start(now - timedelta(hours=hours))
+        last = LatencySketchService._window_start(now)
+        step = LatencySketchService.BUCKET_MINUTES * 60
+
+        try:
+            async with redis_conn.pipeline(transaction=False) as pipe:
+                for window_start in range(first, last + step, step):
+                    pipe.hgetall(LatencySketchService._key(project_id, window_start))
+                windows = await pipe.execute()
+        except redis.RedisError:
+            return None
+
+        counts: dict[int, int] = {}
+        for window in windows:
+            for bucket, count in window.items():
+                bucket = int(bucket)
+                counts[bucket] = counts.get(bucket, 0) + int(count)
+
+        total = sum(counts.values())
+        if total == 0:
+            return None
+
+        rank = percentile * total
+        seen = 0
+        for bucket in sorted(counts):
+            seen += counts[bucket]
+            if seen >= rank:
+                return LatencySketchService._bucket_value(bucket)
+        return LatencySketchService._bucket_value(max(counts))
@@ -3,22 +3,118 @@ Metrics Service
 
 Aggregates and computes metrics for alerting (cost spikes, latency, etc.)
 """
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, Any, Optional
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, and_, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import RAGTrace, Evaluation
+from app.models import RAGTrace, Evaluation, ProjectHourlyRollup
+
+# Evaluations are committed right after they're inserted, but allow for a
+# little lag (and clock skew between refreshes) when comparing against the watermark
+ROLLUP_WATERMARK_SLACK = timedelta(minutes=5)
 
 
 class MetricsService:
     """Service for computing aggregate metrics."""
 
     @staticmethod
-    def get_daily_cost(db: Session, project_id: str, date: Optional[datetime] = None) -> float:
+    def _upsert_rollup(buckets):
+        """INSERT ... ON CONFLICT UPDATE roll-up rows from a bucket aggregate select."""
+        stmt = insert(ProjectHourlyRollup).from_select(
+            ["project_id", "hour", "traces", "cost_usd", "hallucinations", "evaluations", "refreshed_at"],
+            buckets
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[ProjectHourlyRollup.project_id, ProjectHourlyRollup.hour],
+            set_={
+                "traces": stmt.excluded.traces,
+                "cost_usd": stmt.excluded.cost_usd,
+                "hallucinations": stmt.excluded.hallucinations,
+                "evaluations": stmt.excluded.evaluations,
+                "refreshed_at": stmt.excluded.refreshed_at,
+            }
+        )
+
+
+    @staticmethod
+    async def update_hourly_rollup(db: AsyncSession) -> None:
+        """
+        Bring the hourly roll-up up to date.
+
+        Recomputes buckets from the hour before the latest stored one onwards
+        (the still-filling current hour), plus the older hours of any trace
+        whose evaluation was written since the last refresh (the watermark is
+        the latest refreshed_at), so backlogged or reclaimed evaluations are
+        still counted.
+
+        Args:
+            db: Database session
+        """
+        latest_hour, watermark = (
+            await db.execute(
+                select(func.max(ProjectHourlyRollup.hour), func.max(ProjectHourlyRollup.refreshed_at))
+            )
+        ).one()
+
+        hour = func.date_trunc("hour", RAGTrace.created_at, type_=DateTime(timezone=True))
+        aggregates = (
+            func.count(RAGTrace.id),
+            func.coalesce(func.sum(Evaluation.evaluation_cost_usd), 0),
+            func.count(Evaluation.id).filter(Evaluation.hallucination_detected == True),
+            func.count(Evaluation.id),
+            func.now(),
+        )
+
+        recent = select(RAGTrace.project_id, hour, *aggregates).outerjoin(
+            Evaluation, Evaluation.trace_id == RAGTrace.id
+        ).group_by(RAGTrace.project_id, hour)
+
+        if latest_hour is not None:
+            recent_start = latest_hour - timedelta(hours=1)
+            recent = recent.where(RAGTrace.created_at >= recent_start)
+
+        await db.execute(MetricsService._upsert_rollup(recent))
+
+        if latest_hour is not None and watermark is not None:
+            # Older hours that gained evaluations since the last refresh
+            late_hours = select(RAGTrace.project_id, hour.label("hour")).join(
+                Evaluation, Evaluation.trace_id == RAGTrace.id
+            ).where(
+                Evaluation.evaluated_at >= watermark - ROLLUP_WATERMARK_SLACK,
+                RAGTrace.created_at < recent_start
+            ).distinct().subquery()
+
+            late = select(late_hours.c.project_id, late_hours.c.hour, *aggregates).select_from(
+                late_hours
+            ).join(
+                RAGTrace,
+                and_(
+                    RAGTrace.project_id == late_hours.c.project_id,
+                    RAGTrace.created_at >= late_hours.c.hour,
+                    RAGTrace.created_at < late_hours.c.hour + timedelta(hours=1)
+                )
+            ).outerjoin(
+                Evaluation, Evaluation.trace_id == RAGTrace.id
+            ).group_by(late_hours.c.project_id, late_hours.c.hour)
+
+            await db.execute(MetricsService._upsert_rollup(late))
+
+        await db.commit()
+
+
+    @staticmethod
+    async def get_daily_cost(db: AsyncSession, project_id: str, date: Optional[datetime] = None) -> float:
         """
         Calculate total evaluation cost for a project on a given day.
 
+        Read from the hourly roll-up, which changes what "a day's cost" means:
+        cost counts toward the UTC day the trace was created, not the day it was
+        evaluated (evaluated_at), so an evaluation that finishes after midnight
+        is billed to the previous day. The roll-up is refreshed by the worker
+        every METRICS_REFRESH_INTERVAL_SECONDS (60s), so results can be that stale.
+
         Args:
             db: Database session
             project_id: Project UUID
@@ -28,26 +124,55 @@ class MetricsService:
             Total cost in USD
         """
         if date is None:
-            date = datetime.utcnow()
-
-        # Start and end of the day
-        start_of_day = datetime(date.year, date.month, date.day, 0, 0, 0)
-        end_of_day = start_of_day + timedelta(days=1)
-
-        # Sum all evaluation costs for traces in this project on this day
-        result = db.query(func.sum(Evaluation.evaluation_cost_usd)).join(
-            RAGTrace, Evaluation.trace_id == RAGTrace.id
-        ).filter(
-            RAGTrace.project_id == project_id,
-            Evaluation.evaluated_at >= start_of_day,
-            Evaluation.evaluated_at < end_of_day
-        ).scalar()
+            date = datetime.now(timezone.utc)
+
+        start_of_day = datetime(date.year, date.month, date.day, 0, 0, 0, tzinfo=timezone.utc)
+
+        daily_costs = await MetricsService.get_daily_costs(
+            db, project_id, start_of_day, until=start_of_day + timedelta(days=1)
+        )
+        return daily_costs.get(start_of_day.date(), 0.0)
+
+
+    @staticmethod
+    async def get_daily_costs(
+        db: AsyncSession,
+        project_id: str,
+        since: datetime,
+        until: Optional[datetime] = None
+    ) -> Dict[date, float]:
+        """
+        Total evaluation cost for a project per UTC day, in one query.
+
+        Same semantics as get_daily_cost: days are the traces' creation days
+        (not evaluated_at), read from the roll-up as of its last refresh.
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+            since: Start of the window (inclusive)
+            until: End of the window (exclusive, defaults to open-ended)
+
+        Returns:
+            Cost in USD keyed by day; days without traces are omitted
+        """
+        # Bucket in UTC regardless of the session time zone
+        day = func.date_trunc("day", func.timezone("UTC", ProjectHourlyRollup.hour)).label("day")
+
+        query = select(day, func.sum(ProjectHourlyRollup.cost_usd)).where(
+            ProjectHourlyRollup.project_id == project_id,
+            ProjectHourlyRollup.hour >= since
+        )
+        if until is not None:
+            query = query.where(ProjectHourlyRollup.hour < until)
 
-        return float(result) if result else 0.0
+        rows = (await db.execute(query.group_by(day))).all()
+
+        return {bucket.date(): float(cost) if cost else 0.0 for bucket, cost in rows}
 
 
     @staticmethod
-    def get_p95_latency(db: Session, project_id: str, hours: int = 1) -> Optional[float]:
+    async def get_p95_latency(db: AsyncSession, project_id: str, hours: int = 1) -> Optional[float]:
         """
         Calculate P95 latency for a project over the last N hours.
 
@@ -59,29 +184,32 @@ class MetricsService:
         Returns:
             P95 latency in milliseconds, or None if no data
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-        # Get all latencies for this project in the time window
-        latencies = db.query(RAGTrace.latency_ms).filter(
-            RAGTrace.project_id == project_id,
-            RAGTrace.created_at >= cutoff_time,
-            RAGTrace.latency_ms.isnot(None)
-        ).order_by(RAGTrace.latency_ms).all()
-
-        if not latencies:
-            return None
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        # Let Postgres compute the percentile instead of shipping every latency over
+        p95_latency = (
+            await db.execute(
+                select(
+                    func.percentile_cont(0.95).within_group(RAGTrace.latency_ms.asc())
+                ).where(
+                    RAGTrace.project_id == project_id,
+                    RAGTrace.created_at >= cutoff_time,
+                    RAGTrace.latency_ms.isnot(None)
+                )
+            )
+        ).scalar()
 
-        # Calculate P95
-        latency_values = [l[0] for l in latencies]
-        p95_index = int(len(latency_values) * 0.95)
-        return float(latency_values[p95_index])
+        return float(p95_latency) if p95_latency is not None else None
 
 
     @staticmethod
-    def get_hourly_trace_count(db: Session, project_id: str, hours: int = 1) -> int:
+    async def get_hourly_trace_count(db: AsyncSession, project_id: str, hours: int = 1) -> int:
         """
         Count traces for a project in the last N hours.
 
+        Read from the hourly roll-up, so the window starts at the top of the
+        hour containing the cutoff.
+
         Args:
             db: Database session
             project_id: Project UUID
@@ -90,21 +218,32 @@ class MetricsService:
         Returns:
             Number of traces
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-        count = db.query(func.count(RAGTrace.id)).filter(
-            RAGTrace.project_id == project_id,
-            RAGTrace.created_at >= cutoff_time
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        count = (
+            await db.execute(
+                select(func.sum(ProjectHourlyRollup.traces)).where(
+                    ProjectHourlyRollup.project_id == project_id,
+                    ProjectHourlyRollup.hour >= func.date_trunc("hour", cutoff_time)
+                )
+            )
         ).scalar()
 
         return int(count) if count else 0
 
 
     @staticmethod
-    def get_hallucination_rate(db: Session, project_id: str, hours: int = 24) -> Dict[str, Any]:
+    async def get_hallucination_rate(db: AsyncSession, project_id: str, hours: int = 24) -> Dict[str, Any]:
         """
         Calculate hallucination rate for a project over the last N hours.
 
+        Read from the hourly roll-up, which buckets evaluations by the hour
+        their trace was created, not by evaluated_at. The window therefore
+        covers evaluations of traces created since the top of the hour
+        containing the cutoff: a 24 hour window spans up to 25 hours, and an
+        evaluation that lagged its trace is counted in the trace's hour.
+        Counts can also be up to a minute stale (the roll-up refresh interval).
+
         Args:
             db: Database session
             project_id: Project UUID
@@ -113,24 +252,20 @@ class MetricsService:
         Returns:
             Dictionary with total_evaluations, hallucinations, and rate
         """
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-
-        # Count total evaluations
-        total = db.query(func.count(Evaluation.id)).join(
-            RAGTrace, Evaluation.trace_id == RAGTrace.id
-        ).filter(
-            RAGTrace.project_id == project_id,
-            Evaluation.evaluated_at >= cutoff_time
-        ).scalar()
-
-        # Count hallucinations
-        hallucinations = db.query(func.count(Evaluation.id)).join(
-            RAGTrace, Evaluation.trace_id == RAGTrace.id
-        ).filter(
-            RAGTrace.project_id == project_id,
-            Evaluation.evaluated_at >= cutoff_time,
-            Evaluation.hallucination_detected == True
-        ).scalar()
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        # Sum total evaluations and hallucinations over the window's hourly buckets
+        total, hallucinations = (
+            await db.execute(
+                select(
+                    func.sum(ProjectHourlyRollup.evaluations),
+                    func.sum(ProjectHourlyRollup.hallucinations)
+                ).where(
+                    ProjectHourlyRollup.project_id == project_id,
+                    ProjectHourlyRollup.hour >= func.date_trunc("hour", cutoff_time)
+                )
+            )
+        ).one()
 
         total = int(total) if total else 0
         hallucinations = int(hallucinations) if hallucinations else 0
@@ -3,12 +3,102 @@ Slack Integration Service
 
 Handles sending alerts to Slack via webhooks.
 """
+import copy
+import logging
 import httpx
-from typing import Dict, Any, Optional
-from datetime import datetime
+import orjson
+from functools import lru_cache
+from typing import Dict, Any, Final, Optional
+from datetime import datetime, timezone
 
 from app.models.alert import AlertType, Severity
 
+logger = logging.getLogger(__name__)
+
+# Emoji and attachment color per severity
+_SEVERITY_CONFIG: Final[dict[Severity, dict[str, str]]] = {
+    Severity.INFO: {"emoji": "ℹ️", "color": "#36a64f"},  # Green
+    Severity.WARNING: {"emoji": "⚠️", "color": "#ff9900"},  # Orange
+    Severity.CRITICAL: {"emoji": "🚨", "color": "#ff0000"},  # Red
+}
+_DEFAULT_SEVERITY_CONFIG: Final[dict[str, str]] = _SEVERITY_CONFIG[Severity.INFO]
+
+# Emoji per alert type
+_TYPE_EMOJI: Final[dict[AlertType, str]] = {
+    AlertType.HALLUCINATION: "🤥",
+    AlertType.COST_SPIKE: "💰",
+    AlertType.HIGH_LATENCY: "⏱️",
+    AlertType.QUALITY_DROP: "📉",
+    AlertType.ERROR_RATE: "❌",
+}
+
+_JSON_HEADERS: Final[dict[str, str]] = {"content-type": "application/json"}
+
+# Shared client so alerts reuse pooled keep-alive connections to Slack
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_slack_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@lru_cache(maxsize=1024)
+def _message_template(
+    project_name: str,
+    severity: Severity,
+    alert_type: AlertType
+) -> tuple[str, dict[str, Any]]:
+    """
+    Build the parts of a Slack message that only depend on project, severity and type.
+
+    Cached so repeat alerts (e.g. per-trace hallucinations) only fill in the
+    text, time and metadata. Callers must copy the attachment and its field
+    list before adding to them; the field dicts themselves are never mutated.
+
+    Returns:
+        Tuple of (header text, attachment template)
+    """
+    config = _SEVERITY_CONFIG.get(severity, _DEFAULT_SEVERITY_CONFIG)
+    alert_emoji = _TYPE_EMOJI.get(alert_type, "⚡")
+    alert_title = alert_type.value.replace('_', ' ').title()
+
+    header = f"{config['emoji']} {alert_emoji} **{alert_title}** Alert"
+    attachment = {
+        "color": config["color"],
+        "title": f"{severity.value.upper()}: {alert_title}",
+        "fields": (
+            {
+                "title": "Project",
+                "value": project_name,
+                "short": True
+            },
+            {
+                "title": "Severity",
+                "value": severity.value.upper(),
+                "short": True
+            },
+        ),
+        "footer": "Aether RAG Monitoring",
+        "footer_icon": "https://platform.slack-edge.com/img/default_application_icon.png",
+    }
+    return header, attachment
+
 
 class SlackService:
     """Service for sending alerts to Slack."""
@@ -39,55 +129,22 @@ class SlackService:
         if not webhook_url:
             return False
 
-        # Choose emoji and color based on severity
-        severity_config = {
-            Severity.INFO: {"emoji": "ℹ️", "color": "#36a64f"},  # Green
-            Severity.WARNING: {"emoji": "⚠️", "color": "#ff9900"},  # Orange
-            Severity.CRITICAL: {"emoji": "🚨", "color": "#ff0000"},  # Red
-        }
-
-        config = severity_config.get(severity, {"emoji": "ℹ️", "color": "#36a64f"})
-
-        # Choose alert type emoji
-        type_emoji = {
-            AlertType.HALLUCINATION: "🤥",
-            AlertType.COST_SPIKE: "💰",
-            AlertType.HIGH_LATENCY: "⏱️",
-            AlertType.QUALITY_DROP: "📉",
-            AlertType.ERROR_RATE: "❌",
-        }
-
-        alert_emoji = type_emoji.get(alert_type, "⚡")
+        # Build Slack message from the cached template, filling only the per-alert parts
+        header, template = _message_template(project_name, severity, alert_type)
+        attachment = copy.copy(template)
+        attachment["text"] = message
+        attachment["fields"] = [
+            *template["fields"],
+            {
+                "title": "Time",
+                "value": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+                "short": False
+            }
+        ]
 
-        # Build Slack message
         slack_message = {
-            "text": f"{config['emoji']} {alert_emoji} **{alert_type.value.replace('_', ' ').title()}** Alert",
-            "attachments": [
-                {
-                    "color": config["color"],
-                    "title": f"{severity.value.upper()}: {alert_type.value.replace('_', ' ').title()}",
-                    "text": message,
-                    "fields": [
-                        {
-                            "title": "Project",
-                            "value": project_name,
-                            "short": True
-                        },
-                        {
-                            "title": "Severity",
-                            "value": severity.value.upper(),
-                            "short": True
-                        },
-                        {
-                            "title": "Time",
-                            "value": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
-                            "short": False
-                        }
-                    ],
-                    "footer": "Aether RAG Monitoring",
-                    "footer_icon": "https://platform.slack-edge.com/img/default_application_icon.png"
-                }
-            ]
+            "text": header,
+            "attachments": [attachment]
         }
 
         # Add metadata fields if available
@@ -109,15 +166,14 @@ class SlackService:
                 })
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    webhook_url,
-                    json=slack_message,
-                    timeout=10.0
-                )
-                return response.status_code == 200
+            response = await _get_client().post(
+                webhook_url,
+                content=orjson.dumps(slack_message),
+                headers=_JSON_HEADERS
+            )
+            return response.status_code == 200
         except Exception as e:
-            print(f"   ⚠️  Failed to send Slack alert: {e}")
+            logger.warning(f"⚠️  Failed to send Slack alert: {e}")
             return False
 
 
@@ -3,173 +3,534 @@
 Evaluation Worker - Processes traces from Redis queue and computes metrics.
 
 This worker:
-1. Polls the evaluation_queue in Redis
+1. Reads jobs from the evaluation stream in Redis (consumer group)
 2. Fetches trace data from the database
 3. Computes evaluation metrics
 4. Saves results to the evaluations table
 """
-import json
 import asyncio
+import hashlib
+import importlib.util
+import logging
+import logging.handlers
+import math
+import queue
+import re
 import sys
 import os
-from datetime import datetime, timedelta
+import socket
+import time
+from functools import lru_cache, partial
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 from uuid import UUID
-from decimal import Decimal
-
-from app.core.database import SessionLocal
+import orjson
+from dotenv import load_dotenv
+from sqlalchemy import select, and_, or_, Row
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.core.redis_client import get_redis
-from app.models import RAGTrace, Evaluation, Alert, AlertType, Severity, AlertConfig, Project
-from app.services.slack_service import SlackService
+from app.core.rate_limiter import TokenBucket
+from app.core.evaluation_queue import (
+    ensure_consumer_group,
+    read_evaluation_jobs,
+    claim_stale_jobs,
+    touch_evaluation_jobs,
+    ack_evaluation_jobs,
+    STALE_JOB_IDLE_MS,
+)
+from app.models import RAGTrace, Evaluation, Alert, AlertType, Severity, Project
+from app.services.slack_service import SlackService, close_slack_client
+from app.services.faithfulness_judge_service import FaithfulnessJudgeService, close_judge_client
 from app.services.metrics_service import MetricsService
+from app.services.cache_service import CacheService
+from app.services.latency_sketch_service import LatencySketchService
 
-# RAGAS imports
-try:
-    from ragas.metrics import faithfulness
-    from ragas import evaluate
-    from datasets import Dataset
-    RAGAS_AVAILABLE = True
-except ImportError:
-    RAGAS_AVAILABLE = False
-    print("⚠️  RAGAS not available. Faithfulness scoring will be skipped.")
+# RAGAS (and the datasets/torch stack under it) is only imported when the first
+# faithfulness score is computed, so startup stays fast and workers that never
+# call OpenAI don't carry it in memory
+RAGAS_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ("ragas", "datasets"))
 
+_ragas_modules: Optional[tuple] = None
 
-async def process_evaluation_queue():
+
+def _ensure_ragas() -> tuple:
     """
-    Main worker loop that processes evaluation jobs from Redis queue.
+    Import RAGAS on first use.
 
-    Runs indefinitely, blocking on Redis queue for new jobs.
-    """
-    print("=" * 70)
-    print("🚀 Aether Evaluation Worker Starting")
-    print("=" * 70)
-    print(f"Started at: {datetime.utcnow().isoformat()}")
-    print(f"RAGAS Available: {'✅ Yes' if RAGAS_AVAILABLE else '❌ No'}")
-    if RAGAS_AVAILABLE:
-        openai_key = os.getenv("OPENAI_API_KEY", "")
-        if openai_key and openai_key != "your-openai-key":
-            print(f"OpenAI API Key: ✅ Configured")
-        else:
-            print(f"OpenAI API Key: ⚠️  Not configured (faithfulness will be skipped)")
-    print("Waiting for evaluation jobs...")
-    print()
+    Returns:
+        Tuple of (evaluate, faithfulness metric, Dataset, dataset Features)
+    """
+    global _ragas_modules
+    if _ragas_modules is None:
+        from ragas.metrics import faithfulness
+        from ragas import evaluate
+        from datasets import Dataset, Features, Sequence, Value
+        # Fixed schema, so building each batch's Dataset skips Arrow type inference
+        features = Features({
+            "question": Value("string"),
+            "answer": Value("string"),
+            "contexts": Sequence(Value("string")),
+        })
+        _ragas_modules = (evaluate, faithfulness, Dataset, features)
+    return _ragas_modules
+
+
+def _openai_configured() -> bool:
+    """Whether a real OpenAI key is configured (environment or .env, via settings)."""
+    openai_key = settings.openai_api_key or ""
+    return bool(openai_key) and openai_key != "your-openai-key"
+
+
+logger = logging.getLogger("evaluator")
+
+# Loggers routed through the worker's log queue
+WORKER_LOGGERS = (logger, logging.getLogger("app"))
+
+# Trace columns the evaluator reads; metadata, token counts and cost are never needed
+TRACE_EVAL_COLUMNS = (
+    RAGTrace.id,
+    RAGTrace.project_id,
+    RAGTrace.query,
+    RAGTrace.response,
+    RAGTrace.contexts,
+    RAGTrace.latency_ms,
+    RAGTrace.created_at,
+)
+
+# Model RAGAS judges faithfulness with (its default), and the judging
+# temperature; both are part of the result cache key
+RAGAS_MODEL = "gpt-3.5-turbo"
+FAITHFULNESS_TEMPERATURE = 0
+
+# Defaults for projects without an alert config: skip the faithfulness check
+# when at least this much of an answer of at least this many words is
+# copied from its contexts, since the LLM verdict then rarely changes
+FAITHFULNESS_SKIP_OVERLAP = 0.9
+FAITHFULNESS_SKIP_MIN_WORDS = 20
+
+# RAGAS faithfulness makes two LLM calls per trace (extract statements, then verify them)
+RAGAS_REQUESTS_PER_TRACE = 2
+
+# Paces faithfulness OpenAI calls under the account limits instead of hitting 429s and backing off
+_openai_rate_limiter = TokenBucket(settings.openai_rpm_limit, settings.openai_tpm_limit)
+
+# How often each consumer takes over jobs left pending by consumers that died
+STALE_CLAIM_INTERVAL_SECONDS = 60
+
+# How often a consumer refreshes the idle time of the jobs it holds (the batch
+# being evaluated and the prefetched one), well inside the stale-claim idle time
+JOB_KEEPALIVE_INTERVAL_SECONDS = STALE_JOB_IDLE_MS / 1000 / 4
+
+# Totals are logged at INFO each time this many more jobs have been processed
+LOG_HEARTBEAT_JOBS = 1000
+
+# How often the hourly metrics roll-up used by the alert checks is updated
+METRICS_REFRESH_INTERVAL_SECONDS = 60
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Send worker logs through a queue drained by a background thread.
 
-    redis_conn = await get_redis()
+    Logging calls only enqueue the record, so a slow stdout (e.g. Docker piping
+    to journald) never blocks the event loop. Covers the worker's own logger and
+    the app.* service loggers it calls into (Slack, queue, ...).
 
-    processed_count = 0
-    error_count = 0
+    Returns:
+        The started listener; stop it with stop_logging() on shutdown
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
 
-    while True:
-        db = SessionLocal()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for worker_logger in WORKER_LOGGERS:
+        worker_logger.handlers = [queue_handler]
+        worker_logger.setLevel(settings.worker_log_level.upper())
+        worker_logger.propagate = False
 
-        try:
-            # Block on Redis queue for up to 5 seconds
-            job_data = await redis_conn.brpop("evaluation_queue", timeout=5)
+    listener.start()
+    return listener
 
-            if job_data:
-                _, job_json = job_data
-                job = json.loads(job_json)
 
-                trace_id = job["trace_id"]
-                job_id = job["job_id"]
+def stop_logging(listener: logging.handlers.QueueListener) -> None:
+    """
+    Flush queued log records and log directly from then on.
 
-                print(f"📥 Processing evaluation job: {job_id}")
-                print(f"   Trace ID: {trace_id}")
+    Anything logged after the listener stops (e.g. main()'s Ctrl-C message)
+    would otherwise sit in a queue nobody drains.
 
-                # Load trace from database
-                trace = db.query(RAGTrace).filter(
-                    RAGTrace.id == UUID(trace_id)
-                ).first()
+    Args:
+        listener: Listener returned by configure_logging()
+    """
+    listener.stop()
+    for worker_logger in WORKER_LOGGERS:
+        worker_logger.handlers = list(listener.handlers)
 
-                if not trace:
-                    print(f"   ❌ Trace not found: {trace_id}")
-                    error_count += 1
-                    continue
 
-                # Check if evaluation already exists
-                existing_eval = db.query(Evaluation).filter(
-                    Evaluation.trace_id == trace.id
-                ).first()
+async def refresh_metrics_periodically():
+    """Keep the hourly metrics roll-up fresh while the worker runs."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await MetricsService.update_hourly_rollup(db)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to refresh hourly metrics: {e}")
+        await asyncio.sleep(METRICS_REFRESH_INTERVAL_SECONDS)
 
-                if existing_eval:
-                    print(f"   ⚠️  Evaluation already exists, skipping")
-                    continue
 
-                print(f"   🔄 Running evaluations...")
-
-                # Compute evaluation metrics
-                results = await run_evaluations(trace)
-
-                # Create evaluation record
-                evaluation = Evaluation(
-                    trace_id=trace.id,
-                    context_precision=results.get("context_precision"),
-                    context_recall=results.get("context_recall"),
-                    answer_relevancy=results.get("answer_relevancy"),
-                    faithfulness=results.get("faithfulness"),
-                    hallucination_detected=results.get("hallucination_detected", False),
-                    toxicity_score=results.get("toxicity_score"),
-                    pii_detected=results.get("pii_detected", False),
-                    token_overlap_ratio=results.get("token_overlap_ratio"),
-                    answer_length=results.get("answer_length"),
-                    evaluation_cost_usd=results.get("evaluation_cost_usd"),
-                    evaluated_at=datetime.utcnow()
-                )
+async def process_evaluation_queue():
+    """
+    Main worker loop that processes evaluation jobs from Redis queue.
+
+    Runs settings.eval_concurrency consumers side by side, each blocking on the
+    Redis stream for its own batches, so one batch waiting on OpenAI doesn't
+    hold up reading, loading and writing the next.
+    """
+    log_listener = configure_logging()
 
-                db.add(evaluation)
-                db.commit()
-                db.refresh(evaluation)
+    logger.info("🚀 Aether Evaluation Worker Starting")
+    logger.info(f"Faithfulness judge: {settings.faithfulness_judge} ({_faithfulness_model()})")
+    if settings.faithfulness_judge == "ragas":
+        if RAGAS_AVAILABLE:
+            logger.info("RAGAS Available: ✅ Yes")
+        else:
+            logger.warning("RAGAS Available: ⚠️  No (faithfulness will be skipped)")
+    if _openai_configured():
+        logger.info("OpenAI API Key: ✅ Configured")
+    else:
+        logger.warning("OpenAI API Key: ⚠️  Not configured (faithfulness will be skipped)")
+    logger.info(f"Concurrent batches: {settings.eval_concurrency}")
+    logger.info("Waiting for evaluation jobs...")
 
-                processed_count += 1
+    redis_conn = await get_redis()
+    await ensure_consumer_group(redis_conn)
+    consumer_prefix = f"{socket.gethostname()}-{os.getpid()}"
 
-                print(f"   ✅ Evaluation complete!")
-                print(f"      Token Overlap: {results.get('token_overlap_ratio', 0):.2%}")
-                print(f"      Answer Length: {results.get('answer_length')} words")
+    stats = {"processed": 0, "errors": 0}
 
-                if results.get('faithfulness') is not None:
-                    print(f"      Faithfulness: {results.get('faithfulness'):.2f}")
-                    if results.get('hallucination_detected'):
-                        print(f"      ⚠️  HALLUCINATION DETECTED (score < 0.5)")
-                    print(f"      Evaluation Cost: ${results.get('evaluation_cost_usd', 0):.4f}")
+    metrics_refresher = asyncio.create_task(refresh_metrics_periodically())
+    consumers = [
+        asyncio.create_task(supervise_consumer(redis_conn, f"{consumer_prefix}-{i}", stats))
+        for i in range(settings.eval_concurrency)
+    ]
 
-                # Check for alerts and send to Slack
-                await check_and_send_alerts(db, trace, evaluation, results)
+    try:
+        await asyncio.gather(*consumers)
+    except asyncio.CancelledError:
+        logger.info("🛑 Shutting down worker...")
+        raise
+    finally:
+        for task in consumers:
+            task.cancel()
+        # Let consumers close their sessions; batches they were working on
+        # stay pending in the consumer group and are reclaimed on restart
+        await asyncio.gather(*consumers, return_exceptions=True)
+        metrics_refresher.cancel()
+        await close_slack_client()
+        await close_judge_client()
+
+        logger.info("👋 Evaluation Worker Stopped")
+        logger.info(f"Total processed: {stats['processed']}")
+        logger.info(f"Total errors: {stats['errors']}")
+        cache_info = _context_tokens.cache_info()
+        logger.info(f"Context token cache: {cache_info.currsize} entries, {cache_info.hits} hits / {cache_info.misses} misses")
+        stop_logging(log_listener)
+
+
+async def keep_jobs_claimed(
+    redis_conn,
+    consumer: str,
+    jobs: List[tuple],
+    next_read: asyncio.Task
+) -> None:
+    """
+    Touch a consumer's in-flight jobs until cancelled, so they never look abandoned.
 
-                print(f"   📊 Total processed: {processed_count} | Errors: {error_count}")
-                print()
+    Args:
+        redis_conn: Redis client
+        consumer: Consumer name that owns the jobs
+        jobs: (entry_id, job) pairs of the batch being evaluated
+        next_read: Prefetch of the next batch; its jobs are touched once it's read
+    """
+    while True:
+        await asyncio.sleep(JOB_KEEPALIVE_INTERVAL_SECONDS)
 
-        except KeyboardInterrupt:
-            print("\n🛑 Shutting down worker...")
-            break
+        entry_ids = [entry_id for entry_id, _ in jobs]
+        if next_read.done() and not next_read.cancelled() and next_read.exception() is None:
+            entry_ids.extend(entry_id for entry_id, _ in next_read.result())
 
+        try:
+            await touch_evaluation_jobs(redis_conn, consumer, *entry_ids)
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to refresh in-flight evaluation jobs: {e}")
+
+
+async def supervise_consumer(redis_conn, consumer: str, stats: Dict[str, int]):
+    """
+    Run a consumer, restarting it if it dies, so one failure (e.g. Redis down
+    while it starts up) doesn't take the other consumers down with it.
+
+    Args:
+        redis_conn: Redis client
+        consumer: Consumer name, unique per consumer task
+        stats: Counters shared by all consumers ("processed", "errors")
+    """
+    while True:
+        try:
+            await consume_evaluation_jobs(redis_conn, consumer, stats)
         except Exception as e:
-            error_count += 1
-            print(f"   ❌ Error processing evaluation: {e}")
-            print(f"   📊 Total processed: {processed_count} | Errors: {error_count}")
-            print()
-            db.rollback()
+            logger.error(f"❌ Consumer {consumer} failed, restarting: {e}")
             await asyncio.sleep(1)
 
-        finally:
-            db.close()
 
-    print()
-    print("=" * 70)
-    print("👋 Evaluation Worker Stopped")
-    print("=" * 70)
-    print(f"Total processed: {processed_count}")
-    print(f"Total errors: {error_count}")
-    print()
+async def consume_evaluation_jobs(redis_conn, consumer: str, stats: Dict[str, int]):
+    """
+    Read and evaluate batches from the stream as one consumer of the group.
+
+    Args:
+        redis_conn: Redis client
+        consumer: Consumer name, unique per consumer task
+        stats: Counters shared by all consumers ("processed", "errors")
+    """
+    # One session for the consumer's lifetime; its connection goes back to the
+    # pool between transactions, so idle polling doesn't churn sessions
+    db = AsyncSessionLocal()
+
+    jobs: List[tuple] = []
+    last_claim: Optional[float] = None
+
+    # Read of the next batch, started while the current one is being evaluated
+    next_read: Optional[asyncio.Task] = None
+
+    try:
+        while True:
+            # Pick up jobs a previous worker read but never acknowledged, at
+            # startup and then every interval however busy this consumer is,
+            # so a crashed worker's jobs don't wait for the stream to go quiet.
+            # They're evaluated as the next batch; a prefetched batch waits
+            # behind them and stays claimed meanwhile
+            if last_claim is None or time.monotonic() - last_claim >= STALE_CLAIM_INTERVAL_SECONDS:
+                last_claim = time.monotonic()
+                try:
+                    jobs = await claim_stale_jobs(redis_conn, consumer)
+                except Exception as e:
+                    logger.error(f"❌ Error reclaiming evaluation jobs: {e}")
+                if jobs:
+                    logger.info(f"♻️  Reclaimed {len(jobs)} unacknowledged jobs")
+
+            if not jobs:
+                try:
+                    # Block on the stream for up to 5 seconds, taking a batch at a time
+                    jobs = await (next_read or read_evaluation_jobs(redis_conn, consumer, block_ms=5000))
+                except Exception as e:
+                    logger.error(f"❌ Error reading evaluation jobs: {e}")
+                    await asyncio.sleep(1)
+                    continue
+                finally:
+                    next_read = None
+
+                if not jobs:
+                    continue
+
+            # Overlap the Redis round trip for the next batch with this batch's DB work
+            if next_read is None:
+                next_read = asyncio.create_task(read_evaluation_jobs(redis_conn, consumer, block_ms=5000))
+
+            # Failed batches stay pending in the consumer group and are retried later
+            acknowledge = True
+
+            # Long batches (RAGAS, rate limiting) must not be reclaimed by other
+            # consumers while this one is still evaluating them
+            keepalive = asyncio.create_task(keep_jobs_claimed(redis_conn, consumer, jobs, next_read))
+
+            try:
+                processed, missing = await evaluate_batch(db, redis_conn, jobs)
+                heartbeats = stats["processed"] // LOG_HEARTBEAT_JOBS
+                stats["processed"] += processed
+                stats["errors"] += missing
+
+                if stats["processed"] // LOG_HEARTBEAT_JOBS > heartbeats:
+                    logger.info(f"📊 Total processed: {stats['processed']} | Errors: {stats['errors']}")
+
+            except Exception as e:
+                acknowledge = False
+                stats["errors"] += len(jobs)
+                logger.error(f"❌ Error processing evaluation batch: {e}")
+                logger.info(f"📊 Total processed: {stats['processed']} | Errors: {stats['errors']}")
+
+                # The failure may have left the connection unusable (e.g. the database
+                # restarted), so discard it rather than rolling back on it
+                await db.invalidate()
+                db = AsyncSessionLocal()
+                await asyncio.sleep(1)
+
+            finally:
+                keepalive.cancel()
+
+                # End any open transaction so no connection is held while blocking on
+                # Redis; this also expires cached rows so the next batch re-reads them
+                try:
+                    await db.rollback()
+                except Exception as e:
+                    logger.error(f"❌ Error ending batch transaction: {e}")
+                    await db.invalidate()
+                    db = AsyncSessionLocal()
+
+                # Unacknowledged jobs are reclaimed and re-evaluated later, which
+                # is safe since evaluations are only inserted once per trace
+                if acknowledge:
+                    try:
+                        await ack_evaluation_jobs(redis_conn, *(entry_id for entry_id, _ in jobs))
+                    except Exception as e:
+                        logger.error(f"❌ Error acknowledging evaluation jobs: {e}")
+
+            jobs = []
+
+    finally:
+        # Jobs a cancelled read already took stay pending and are reclaimed on restart
+        if next_read is not None:
+            next_read.cancel()
+        await db.close()
+
+
+async def evaluate_batch(db: AsyncSession, redis_conn, jobs: List[tuple]) -> tuple[int, int]:
+    """
+    Evaluate a batch of jobs: one query for the traces, one commit for the evaluations.
 
+    Args:
+        db: Database session
+        redis_conn: Redis client
+        jobs: (entry_id, job) pairs read from the evaluation stream
 
-async def run_evaluations(trace: RAGTrace) -> Dict[str, Any]:
+    Returns:
+        Tuple of (evaluations created, traces not found)
+    """
+    trace_ids = list(dict.fromkeys(UUID(job["trace_id"]) for _, job in jobs))
+
+    logger.debug(f"📥 Processing {len(jobs)} evaluation jobs")
+
+    # Load all traces in the batch at once, as plain rows of just the needed
+    # columns, flagging the ones that already have an evaluation
+    already_evaluated = (
+        select(Evaluation.id).where(Evaluation.trace_id == RAGTrace.id).exists().label("evaluated")
+    )
+    traces = (
+        await db.execute(
+            select(*TRACE_EVAL_COLUMNS, already_evaluated).where(RAGTrace.id.in_(trace_ids))
+        )
+    ).all()
+    missing = len(trace_ids) - len(traces)
+    if missing:
+        found = {trace.id for trace in traces}
+        for trace_id in trace_ids:
+            if trace_id not in found:
+                logger.error(f"❌ Trace not found: {trace_id}")
+
+    # Redelivered jobs: don't spend another RAGAS call on them
+    evaluated_before = sum(1 for trace in traces if trace.evaluated)
+    if evaluated_before:
+        logger.warning(f"⚠️  {evaluated_before} evaluations already exist, skipping")
+        traces = [trace for trace in traces if not trace.evaluated]
+
+    if not traces:
+        return 0, missing
+
+    # Load the batch's projects once; alert configs (joined-loaded) tune the
+    # evaluation and drive the alert checks
+    projects = {
+        project.id: project
+        for project in (
+            await db.execute(
+                select(Project).where(Project.id.in_({trace.project_id for trace in traces}))
+            )
+        ).scalars()
+    }
+
+    # End the read transaction before the (slow) scoring: the connection isn't
+    # left idle in transaction, and evaluated_at (now()) is the insert time,
+    # which the hourly roll-up's refresh watermark relies on
+    await db.commit()
+
+    logger.debug(f"🔄 Running evaluations for {len(traces)} traces...")
+
+    # Compute evaluation metrics
+    batch_results = await run_evaluations(traces, redis_conn, projects)
+
+    # Create evaluation records. Traces evaluated by another worker since they
+    # were loaded are skipped by the unique trace_id.
+    inserted = (await db.execute(
+        insert(Evaluation)
+        .on_conflict_do_nothing(index_elements=[Evaluation.trace_id])
+        .returning(Evaluation),
+        [
+            dict(
+                trace_id=trace.id,
+                context_precision=results.get("context_precision"),
+                context_recall=results.get("context_recall"),
+                answer_relevancy=results.get("answer_relevancy"),
+                faithfulness=results.get("faithfulness"),
+                hallucination_detected=results.get("hallucination_detected", False),
+                toxicity_score=results.get("toxicity_score"),
+                pii_detected=results.get("pii_detected", False),
+                token_overlap_ratio=results.get("token_overlap_ratio"),
+                answer_length=results.get("answer_length"),
+                evaluation_cost_usd=results.get("evaluation_cost_usd"),
+            )
+            for trace, results in zip(traces, batch_results)
+        ]
+    )).scalars().all()
+    await db.commit()
+
+    evaluations = {evaluation.trace_id: evaluation for evaluation in inserted}
+    if len(evaluations) < len(traces):
+        logger.warning(f"⚠️  {len(traces) - len(evaluations)} traces were evaluated concurrently, skipping")
+
+    # Per-trace detail is chatty; skip formatting it entirely unless DEBUG is on
+    verbose = logger.isEnabledFor(logging.DEBUG)
+
+    evaluated = []
+    for trace, results in zip(traces, batch_results):
+        evaluation = evaluations.get(trace.id)
+        if evaluation is None:
+            continue
+        evaluated.append((trace, evaluation, results))
+
+        if verbose:
+            logger.debug(f"✅ Evaluation complete for trace {trace.id}")
+            logger.debug(f"   Token Overlap: {results.get('token_overlap_ratio', 0):.2%}")
+            logger.debug(f"   Answer Length: {results.get('answer_length')} words")
+
+            if results.get('faithfulness') is not None:
+                logger.debug(f"   Faithfulness: {results.get('faithfulness'):.2f}")
+                if results.get('hallucination_detected'):
+                    logger.debug("   ⚠️  HALLUCINATION DETECTED (score < 0.5)")
+                logger.debug(f"   Evaluation Cost: ${results.get('evaluation_cost_usd', 0):.4f}")
+
+    # Check for alerts and send to Slack
+    if evaluated:
+        await check_and_send_alerts(db, redis_conn, evaluated, projects)
+
+    return len(evaluations), missing
+
+
+async def run_evaluations(
+    traces: List[Row],
+    redis_conn,
+    projects: Dict[UUID, Project]
+) -> List[Dict[str, Any]]:
     """
-    Run all evaluation metrics on a trace.
+    Run all evaluation metrics on a batch of traces.
 
     Currently implements:
     - Token overlap ratio (fast, no LLM needed)
     - Answer length (fast)
-    - Faithfulness score (RAGAS, uses OpenAI)
+    - Faithfulness score (single-call LLM judge or RAGAS, uses OpenAI)
 
     TODO (Next phase):
     - Answer relevancy, context precision/recall
@@ -178,114 +539,311 @@ async def run_evaluations(trace: RAGTrace) -> Dict[str, Any]:
     - Toxicity scoring
 
     Args:
-        trace: RAGTrace model instance
+        traces: Trace rows with TRACE_EVAL_COLUMNS
+        redis_conn: Redis client, for the faithfulness result cache
+        projects: The traces' projects by id, for per-project evaluation settings
 
     Returns:
-        Dictionary of metric scores
+        Dictionary of metric scores per trace, in the same order as traces
     """
-    results = {}
+    batch_results = []
+    # (results, faithfulness inputs) for traces that have contexts to judge against
+    needs_faithfulness = []
 
-    # Fast metrics (no LLM calls needed)
+    for trace in traces:
+        results = {}
+        context_texts = [ctx.get("text", "") for ctx in trace.contexts] if trace.contexts else []
 
-    # 1. Token overlap ratio - measures how much of the answer comes from contexts
-    if trace.contexts:
-        context_texts = [ctx.get("text", "") for ctx in trace.contexts]
-        results["token_overlap_ratio"] = calculate_token_overlap(
-            trace.response,
-            context_texts
-        )
-    else:
-        results["token_overlap_ratio"] = 0.0
+        # Fast metrics (no LLM calls needed) - both come from one tokenization of the response
+        response_tokens = tokenize(trace.response)
 
-    # 2. Answer length - simple word count
-    results["answer_length"] = len(trace.response.split())
+        # 1. Token overlap ratio - measures how much of the answer comes from contexts
+        results["token_overlap_ratio"] = token_overlap(response_tokens, context_texts)
 
-    # 3. RAGAS Faithfulness Score (LLM-based, detects hallucinations)
-    if trace.contexts and len(trace.contexts) > 0:
-        try:
-            faithfulness_result = await compute_faithfulness(
-                query=trace.query,
-                answer=trace.response,
-                contexts=[ctx.get("text", "") for ctx in trace.contexts]
-            )
-            results["faithfulness"] = faithfulness_result["score"]
-            results["evaluation_cost_usd"] = faithfulness_result["cost"]
+        # 2. Answer length - simple word count
+        results["answer_length"] = len(response_tokens)
 
-            # Mark as hallucination if faithfulness < 0.5
-            results["hallucination_detected"] = faithfulness_result["score"] < 0.5 if faithfulness_result["score"] is not None else False
-        except Exception as e:
-            print(f"   ⚠️  RAGAS faithfulness failed: {e}")
-            results["faithfulness"] = None
-            results["evaluation_cost_usd"] = 0.0
-            results["hallucination_detected"] = False
-    else:
-        # No contexts, can't compute faithfulness
+        # 3. RAGAS Faithfulness Score - filled in below; without contexts it can't be
+        # computed, and answers mostly copied from their contexts skip it
         results["faithfulness"] = None
         results["evaluation_cost_usd"] = 0.0
         results["hallucination_detected"] = False
+        if context_texts and not _well_grounded(results, projects.get(trace.project_id)):
+            needs_faithfulness.append((results, (trace.query, trace.response, context_texts)))
+
+        batch_results.append(results)
+
+    if needs_faithfulness:
+        faithfulness_results = await compute_faithfulness_batch(
+            [inputs for _, inputs in needs_faithfulness], redis_conn
+        )
+        for (results, _), faithfulness_result in zip(needs_faithfulness, faithfulness_results):
+            score = faithfulness_result["score"]
+            results["faithfulness"] = score
+            results["evaluation_cost_usd"] = faithfulness_result["cost"]
+
+            # Mark as hallucination if faithfulness < 0.5
+            results["hallucination_detected"] = score < 0.5 if score is not None else False
+
+    return batch_results
+
+
+def _well_grounded(results: Dict[str, Any], project: Optional[Project]) -> bool:
+    """Whether the fast metrics alone show the answer is grounded in its contexts."""
+    alert_config = project.alert_config if project is not None else None
+    if alert_config is not None:
+        skip_overlap = alert_config.faithfulness_skip_overlap
+        skip_min_words = alert_config.faithfulness_skip_min_words
+    else:
+        skip_overlap = FAITHFULNESS_SKIP_OVERLAP
+        skip_min_words = FAITHFULNESS_SKIP_MIN_WORDS
+
+    return (
+        skip_overlap is not None
+        and results["token_overlap_ratio"] >= skip_overlap
+        and results["answer_length"] >= skip_min_words
+    )
+
+
+def _normalize_for_cache(text: str) -> str:
+    """Collapse whitespace and case, which never change a faithfulness verdict."""
+    return " ".join(text.split()).casefold()
+
+
+def _faithfulness_model() -> str:
+    """The model faithfulness is judged with, as recorded in cache keys."""
+    if settings.faithfulness_judge == "ragas":
+        return f"ragas/{RAGAS_MODEL}"
+    return settings.faithfulness_model
+
+
+def _faithfulness_digest(query: str, answer: str, contexts: List[str]) -> str:
+    """
+    SHA256 of everything a faithfulness score depends on.
+
+    Inputs are normalized first so traces that differ only in casing, spacing
+    or context order share a cache entry. Wording differences deliberately
+    still miss: a near-duplicate answer with one fact changed is exactly the
+    hallucination this score has to catch.
+    """
+    return hashlib.sha256(orjson.dumps({
+        "q": _normalize_for_cache(query),
+        "a": _normalize_for_cache(answer),
+        "c": sorted(_normalize_for_cache(context) for context in contexts),
+        "m": _faithfulness_model(),
+        "t": FAITHFULNESS_TEMPERATURE,
+    })).hexdigest()
+
+
+def _estimate_faithfulness_tokens(query: str, answer: str, contexts: List[str]) -> int:
+    # One token per space-separated word; str.count doesn't build a list like split()
+    return sum(text.count(" ") + 1 for text in (query, answer, *contexts))
 
+
+def _estimate_ragas_cost(query: str, answer: str, contexts: List[str]) -> float:
+    # Estimate cost (OpenAI gpt-3.5-turbo pricing)
+    # Faithfulness typically uses ~500-1000 tokens per evaluation
+    # At $0.001/1K tokens for gpt-3.5-turbo
+    return _estimate_faithfulness_tokens(query, answer, contexts) / 1000 * 0.001
+
+
+async def _score_faithfulness(items: List[tuple]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Score (query, answer, contexts) triples with the configured judge.
+
+    Returns:
+        Dictionary with 'score' and 'cost' keys per item, None where no score
+        could be produced
+    """
+    if settings.faithfulness_judge == "ragas":
+        await _openai_rate_limiter.acquire(
+            requests=RAGAS_REQUESTS_PER_TRACE * len(items),
+            tokens=sum(_estimate_faithfulness_tokens(*item) for item in items)
+        )
+        # evaluate() blocks, so it runs in a thread to keep other batches moving
+        scores = await asyncio.to_thread(_ragas_faithfulness, items)
+        return [
+            {"score": score, "cost": _estimate_ragas_cost(*item)} if score is not None else None
+            for item, score in zip(items, scores)
+        ]
+
+    # One judge call per trace, all in flight at once
+    judged = await asyncio.gather(*(_judge_faithfulness(*item) for item in items), return_exceptions=True)
+    results = []
+    for verdict in judged:
+        if isinstance(verdict, Exception):
+            logger.warning(f"LLM faithfulness judge error: {verdict}")
+            verdict = None
+        results.append(verdict)
     return results
 
 
-async def compute_faithfulness(query: str, answer: str, contexts: List[str]) -> Dict[str, Any]:
+async def _judge_faithfulness(query: str, answer: str, contexts: List[str]) -> Dict[str, Any]:
+    await _openai_rate_limiter.acquire(
+        requests=1,
+        tokens=_estimate_faithfulness_tokens(query, answer, contexts)
+    )
+    return await FaithfulnessJudgeService.score(
+        query, answer, contexts,
+        model=settings.faithfulness_model,
+        temperature=FAITHFULNESS_TEMPERATURE
+    )
+
+
+def _ragas_faithfulness(items: List[tuple]) -> List[Optional[float]]:
+    """
+    Score (query, answer, contexts) triples with a single RAGAS evaluate() call.
+
+    Returns:
+        Faithfulness score per item, None where RAGAS couldn't produce one
+    """
+    evaluate, faithfulness, Dataset, features = _ensure_ragas()
+
+    # Prepare data in RAGAS format
+    dataset = Dataset.from_dict({
+        "question": [query for query, _, _ in items],
+        "answer": [answer for _, answer, _ in items],
+        "contexts": [contexts for _, _, contexts in items],  # RAGAS expects list of lists
+    }, features=features)
+
+    # Run evaluation (this calls OpenAI API)
+    # Note: RAGAS uses OpenAI by default, configured via OPENAI_API_KEY env var
+    result = evaluate(dataset, metrics=[faithfulness])
+
+    # result["faithfulness"] is the mean over the dataset; per-row scores are in
+    # result.scores, with NaN for rows that failed
+    return [
+        float(score) if score is not None and not math.isnan(score) else None
+        for score in result.scores["faithfulness"]
+    ]
+
+
+async def compute_faithfulness_batch(items: List[tuple], redis_conn=None) -> List[Dict[str, Any]]:
     """
-    Compute faithfulness score using RAGAS.
+    Compute faithfulness scores for many traces.
 
     Faithfulness measures whether the answer is grounded in the provided contexts.
     Score ranges from 0.0 (completely unfaithful/hallucinated) to 1.0 (perfectly faithful).
 
+    By default each trace is scored by one LLM judge call (all in flight at
+    once); with faithfulness_judge="ragas" everything is scored in one RAGAS
+    evaluate() call, retried one trace at a time if it fails.
+
+    Results are cached in Redis by a hash of the inputs, so duplicate traces
+    (replays, re-evaluations) skip the OpenAI calls; cache hits cost nothing.
+
+    Args:
+        items: (query, answer, contexts) triples
+        redis_conn: Redis client for the result cache (no caching if None)
+
+    Returns:
+        Dictionary with 'score' and 'cost' keys per item, in the same order
+    """
+    results = [{"score": None, "cost": 0.0} for _ in items]
+    # Without a key every call would fail (so don't even import RAGAS)
+    if not _openai_configured():
+        return results
+    if settings.faithfulness_judge == "ragas" and not RAGAS_AVAILABLE:
+        return results
+
+    # Cache keys of the items that can be scored at all
+    digests = {
+        i: _faithfulness_digest(query, answer, contexts)
+        for i, (query, answer, contexts) in enumerate(items)
+        if contexts and answer
+    }
+
+    # Look the whole batch up in one round trip; what's left still needs scoring
+    to_score = []
+    if redis_conn is not None:
+        cached = await CacheService.get_faithfulness_many(redis_conn, list(digests.values()))
+    else:
+        cached = [None] * len(digests)
+    for i, cached_result in zip(digests, cached):
+        if cached_result is not None:
+            results[i]["score"] = orjson.loads(cached_result)["score"]
+        else:
+            to_score.append(i)
+
+    if not to_score:
+        return results
+
+    try:
+        scored = await _score_faithfulness([items[i] for i in to_score])
+    except Exception as e:
+        logger.warning(f"⚠️  Batched faithfulness scoring failed, retrying per trace: {e}")
+        scored = []
+        for i in to_score:
+            try:
+                scored.extend(await _score_faithfulness([items[i]]))
+            except Exception as e:
+                logger.warning(f"Faithfulness scoring error: {str(e)}")
+                scored.append(None)
+
+    to_cache = {}
+    for i, faithfulness_result in zip(to_score, scored):
+        if faithfulness_result is None or faithfulness_result["score"] is None:
+            continue
+
+        results[i] = faithfulness_result
+        to_cache[digests[i]] = orjson.dumps({"score": faithfulness_result["score"]})
+
+    if redis_conn is not None:
+        await CacheService.set_faithfulness_many(redis_conn, to_cache)
+
+    return results
+
+
+async def compute_faithfulness(
+    query: str,
+    answer: str,
+    contexts: List[str],
+    redis_conn=None
+) -> Dict[str, Any]:
+    """
+    Compute faithfulness score for a single trace using RAGAS.
+
     Args:
         query: The user's question
         answer: The generated response
         contexts: List of retrieved context texts
+        redis_conn: Redis client for the result cache (no caching if None)
 
     Returns:
         Dictionary with 'score' and 'cost' keys
     """
-    if not RAGAS_AVAILABLE:
-        return {"score": None, "cost": 0.0}
+    return (await compute_faithfulness_batch([(query, answer, contexts)], redis_conn))[0]
 
-    if not contexts or not answer:
-        return {"score": None, "cost": 0.0}
 
-    try:
-        # Prepare data in RAGAS format
-        data = {
-            "question": [query],
-            "answer": [answer],
-            "contexts": [contexts],  # RAGAS expects list of lists
-        }
+# Unicode words and numbers (keeping apostrophes); punctuation never becomes part of a token
+_TOKEN_RE = re.compile(r"[\w']+")
 
-        # Create dataset
-        dataset = Dataset.from_dict(data)
 
-        # Run evaluation (this calls OpenAI API)
-        # Note: RAGAS uses OpenAI by default, configured via OPENAI_API_KEY env var
-        result = evaluate(dataset, metrics=[faithfulness])
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercased word tokens.
 
-        # Extract faithfulness score
-        # RAGAS returns a dict with metric names as keys
-        # The value might be a single score or a list (if evaluating multiple items)
-        faithfulness_value = result["faithfulness"]
-        if isinstance(faithfulness_value, list):
-            faithfulness_score = float(faithfulness_value[0]) if faithfulness_value else None
-        else:
-            faithfulness_score = float(faithfulness_value)
+    Tokens are interned so the set operations in token_overlap mostly compare
+    pointers instead of hashing and comparing fresh string copies.
+
+    Args:
+        text: Text to tokenize
 
-        # Estimate cost (OpenAI gpt-3.5-turbo pricing)
-        # Faithfulness typically uses ~500-1000 tokens per evaluation
-        # At $0.001/1K tokens for gpt-3.5-turbo
-        estimated_tokens = len(query.split()) + len(answer.split()) + sum(len(ctx.split()) for ctx in contexts)
-        estimated_cost = Decimal(estimated_tokens / 1000 * 0.001)
+    Returns:
+        List of lowercased tokens, in order
+    """
+    return [sys.intern(token) for token in _TOKEN_RE.findall(text.lower())]
 
-        return {
-            "score": faithfulness_score,
-            "cost": float(estimated_cost)
-        }
 
-    except Exception as e:
-        print(f"      RAGAS faithfulness error: {str(e)}")
-        return {"score": None, "cost": 0.0}
+@lru_cache(maxsize=10_000)
+def _context_tokens(context: str) -> frozenset:
+    """
+    Lowercased token set for a context chunk.
+
+    RAG corpora return the same chunks for many queries, so repeat contexts
+    skip re-tokenizing. Keyed by the text itself: hashing a str is a single C pass.
+    """
+    return frozenset(tokenize(context))
 
 
 def calculate_token_overlap(response: str, contexts: List[str]) -> float:
@@ -303,101 +861,156 @@ def calculate_token_overlap(response: str, contexts: List[str]) -> float:
     Returns:
         Float between 0.0 and 1.0 representing overlap ratio
     """
-    if not response or not contexts:
+    if not response:
         return 0.0
 
-    # Tokenize (simple whitespace split, lowercase)
-    response_tokens = set(response.lower().split())
+    return token_overlap(tokenize(response), contexts)
+
+
+def token_overlap(response_tokens: List[str], contexts: List[str]) -> float:
+    """
+    Token overlap ratio for an already tokenized (lowercased) response.
+
+    Args:
+        response_tokens: Lowercased response tokens
+        contexts: List of retrieved context texts
+
+    Returns:
+        Float between 0.0 and 1.0 representing overlap ratio
+    """
+    if not contexts:
+        return 0.0
 
-    # Combine all contexts
-    combined_context = " ".join(contexts)
-    context_tokens = set(combined_context.lower().split())
+    unmatched = set(response_tokens)
+    unique_count = len(unmatched)
 
-    if not response_tokens:
+    if not unique_count:
         return 0.0
 
+    # Strike response tokens off as they're seen in each context. This never
+    # builds the combined context vocabulary or one concatenated context
+    # string, and stops as soon as every response token has been found.
+    for context in contexts:
+        unmatched -= _context_tokens(context)
+        if not unmatched:
+            break
+
     # Count overlap
-    overlap = len(response_tokens & context_tokens)
+    overlap = unique_count - len(unmatched)
 
-    return overlap / len(response_tokens)
+    return overlap / unique_count
 
 
-async def check_and_send_alerts(db, trace: RAGTrace, evaluation: Evaluation, results: Dict[str, Any]):
+async def check_and_send_alerts(
+    db: AsyncSession,
+    redis_conn,
+    evaluated: List[tuple[Row, Evaluation, Dict[str, Any]]],
+    projects: Dict[UUID, Project]
+):
     """
-    Check if any alert conditions are met and send alerts to Slack.
+    Check if any alert conditions are met for a batch and send alerts to Slack.
+
+    Recent alerts used for spam suppression are loaded with one query, and
+    the project-wide cost and latency checks run once per project rather than
+    once per trace. All new alerts are saved in one commit, then their Slack
+    webhooks fire concurrently.
 
     Args:
         db: Database session
-        trace: RAGTrace instance
-        evaluation: Evaluation instance
-        results: Dictionary of evaluation results
+        redis_conn: Redis client
+        evaluated: (trace row, Evaluation, results) for each new evaluation
+        projects: The batch's projects by id, with alert configs loaded
     """
     try:
-        # Load project and alert config
-        project = db.query(Project).filter(Project.id == trace.project_id).first()
-        if not project:
-            return
-
-        alert_config = db.query(AlertConfig).filter(AlertConfig.project_id == project.id).first()
-        if not alert_config or not alert_config.slack_enabled or not alert_config.slack_webhook_url:
-            return  # No Slack configured for this project
-
-        # 1. Check for hallucination alert
-        if (alert_config.hallucination_alerts_enabled and
-            results.get('hallucination_detected') and
-            results.get('faithfulness') is not None):
-
-            print(f"   📤 Sending hallucination alert to Slack...")
-
-            # Create alert record
-            alert = Alert(
-                project_id=project.id,
-                alert_type=AlertType.HALLUCINATION,
-                severity=Severity.CRITICAL,
-                message=f"Hallucination detected with faithfulness score {results['faithfulness']:.2f}",
-                alert_metadata={
-                    "trace_id": str(trace.id),
-                    "evaluation_id": str(evaluation.id),
-                    "faithfulness_score": results['faithfulness'],
-                    "threshold": alert_config.hallucination_threshold,
-                    "query": trace.query[:200],
-                    "response": trace.response[:300]
-                }
-            )
-            db.add(alert)
-            db.commit()
-
-            # Send to Slack
-            success = await SlackService.send_hallucination_alert(
-                webhook_url=alert_config.slack_webhook_url,
-                project_name=project.name,
-                trace_id=str(trace.id),
-                query=trace.query,
-                response=trace.response,
-                faithfulness_score=results['faithfulness'],
-                threshold=alert_config.hallucination_threshold
-            )
-
-            if success:
-                print(f"   ✅ Hallucination alert sent to Slack")
-            else:
-                print(f"   ⚠️  Failed to send hallucination alert")
-
-        # 2. Check for cost spike alert
-        if alert_config.cost_spike_alerts_enabled and alert_config.daily_cost_budget_usd:
-            daily_cost = MetricsService.get_daily_cost(db, str(project.id))
-
-            if daily_cost > alert_config.daily_cost_budget_usd:
-                # Check if we already sent an alert today to avoid spam
-                recent_cost_alert = db.query(Alert).filter(
-                    Alert.project_id == project.id,
-                    Alert.alert_type == AlertType.COST_SPIKE,
-                    Alert.created_at >= datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                ).first()
-
-                if not recent_cost_alert:
-                    print(f"   📤 Sending cost spike alert to Slack...")
+        # Only projects with Slack configured can be alerted
+        evaluated_project_ids = {trace.project_id for trace, _, _ in evaluated}
+        projects = {
+            project.id: project
+            for project in projects.values()
+            if project.id in evaluated_project_ids
+            and project.alert_config
+            and project.alert_config.slack_enabled
+            and project.alert_config.slack_webhook_url
+        }
+        if not projects:
+            return  # No Slack configured for these projects
+
+        # Alerts already sent recently, to avoid spam: cost spikes once per day,
+        # latency once per hour
+        now = datetime.now(timezone.utc)
+        recently_alerted = set(
+            (
+                await db.execute(
+                    select(Alert.project_id, Alert.alert_type).where(
+                        Alert.project_id.in_(list(projects)),
+                        or_(
+                            and_(
+                                Alert.alert_type == AlertType.COST_SPIKE,
+                                Alert.created_at >= now.replace(hour=0, minute=0, second=0, microsecond=0)
+                            ),
+                            and_(
+                                Alert.alert_type == AlertType.HIGH_LATENCY,
+                                Alert.created_at >= now - timedelta(hours=1)
+                            )
+                        )
+                    ).distinct()
+                )
+            ).all()
+        )
 
+        # Alert rows to save, and (label, send) pairs for their Slack notifications
+        alerts = []
+        notifications = []
+
+        # 1. Check for hallucination alerts (per trace)
+        for trace, evaluation, results in evaluated:
+            project = projects.get(trace.project_id)
+            if project is None:
+                continue
+            alert_config = project.alert_config
+
+            if (alert_config.hallucination_alerts_enabled and
+                results.get('hallucination_detected') and
+                results.get('faithfulness') is not None):
+
+                # Create alert record
+                alert = Alert(
+                    project_id=project.id,
+                    alert_type=AlertType.HALLUCINATION,
+                    severity=Severity.CRITICAL,
+                    message=f"Hallucination detected with faithfulness score {results['faithfulness']:.2f}",
+                    alert_metadata={
+                        "trace_id": str(trace.id),
+                        "evaluation_id": str(evaluation.id),
+                        "faithfulness_score": results['faithfulness'],
+                        "threshold": alert_config.hallucination_threshold,
+                        "query": trace.query[:200],
+                        "response": trace.response[:300]
+                    }
+                )
+                alerts.append(alert)
+                notifications.append(("Hallucination", partial(
+                    SlackService.send_hallucination_alert,
+                    webhook_url=alert_config.slack_webhook_url,
+                    project_name=project.name,
+                    trace_id=str(trace.id),
+                    query=trace.query,
+                    response=trace.response,
+                    faithfulness_score=results['faithfulness'],
+                    threshold=alert_config.hallucination_threshold
+                )))
+
+        for project in projects.values():
+            alert_config = project.alert_config
+
+            # 2. Check for cost spike alert (once per project)
+            if (alert_config.cost_spike_alerts_enabled and
+                alert_config.daily_cost_budget_usd and
+                (project.id, AlertType.COST_SPIKE) not in recently_alerted):
+
+                daily_cost = await MetricsService.get_daily_cost(db, str(project.id))
+
+                if daily_cost > alert_config.daily_cost_budget_usd:
                     alert = Alert(
                         project_id=project.id,
                         alert_type=AlertType.COST_SPIKE,
@@ -409,36 +1022,28 @@ async def check_and_send_alerts(db, trace: RAGTrace, evaluation: Evaluation, res
                             "overage_pct": ((daily_cost - alert_config.daily_cost_budget_usd) / alert_config.daily_cost_budget_usd) * 100
                         }
                     )
-                    db.add(alert)
-                    db.commit()
-
-                    success = await SlackService.send_cost_spike_alert(
+                    alerts.append(alert)
+                    notifications.append(("Cost spike", partial(
+                        SlackService.send_cost_spike_alert,
                         webhook_url=alert_config.slack_webhook_url,
                         project_name=project.name,
                         current_cost=daily_cost,
                         budget=alert_config.daily_cost_budget_usd
-                    )
-
-                    if success:
-                        print(f"   ✅ Cost spike alert sent to Slack")
-                    else:
-                        print(f"   ⚠️  Failed to send cost spike alert")
-
-        # 3. Check for latency alert
-        if alert_config.latency_alerts_enabled and alert_config.latency_p95_threshold_ms:
-            p95_latency = MetricsService.get_p95_latency(db, str(project.id), hours=1)
+                    )))
 
-            if p95_latency and p95_latency > alert_config.latency_p95_threshold_ms:
-                # Check if we already sent an alert in the last hour to avoid spam
-                recent_latency_alert = db.query(Alert).filter(
-                    Alert.project_id == project.id,
-                    Alert.alert_type == AlertType.HIGH_LATENCY,
-                    Alert.created_at >= datetime.utcnow() - timedelta(hours=1)
-                ).first()
+            # 3. Check for latency alert (once per project)
+            if (alert_config.latency_alerts_enabled and
+                alert_config.latency_p95_threshold_ms and
+                (project.id, AlertType.HIGH_LATENCY) not in recently_alerted):
 
-                if not recent_latency_alert:
-                    print(f"   📤 Sending high latency alert to Slack...")
+                p95_latency = await LatencySketchService.get_percentile(
+                    redis_conn, project.id, 0.95, hours=1
+                )
+                if p95_latency is None:
+                    # Sketch empty or Redis unavailable - fall back to the exact query
+                    p95_latency = await MetricsService.get_p95_latency(db, str(project.id), hours=1)
 
+                if p95_latency and p95_latency > alert_config.latency_p95_threshold_ms:
                     alert = Alert(
                         project_id=project.id,
                         alert_type=AlertType.HIGH_LATENCY,
@@ -449,29 +1054,63 @@ async def check_and_send_alerts(db, trace: RAGTrace, evaluation: Evaluation, res
                             "threshold": alert_config.latency_p95_threshold_ms
                         }
                     )
-                    db.add(alert)
-                    db.commit()
-
-                    success = await SlackService.send_latency_alert(
+                    alerts.append(alert)
+                    notifications.append(("Latency", partial(
+                        SlackService.send_latency_alert,
                         webhook_url=alert_config.slack_webhook_url,
                         project_name=project.name,
                         p95_latency=p95_latency,
                         threshold=alert_config.latency_p95_threshold_ms
-                    )
+                    )))
 
-                    if success:
-                        print(f"   ✅ Latency alert sent to Slack")
-                    else:
-                        print(f"   ⚠️  Failed to send latency alert")
+        if not alerts:
+            return
+
+        # Save every alert in one commit before notifying
+        db.add_all(alerts)
+        await db.commit()
+        await asyncio.gather(*(
+            CacheService.invalidate_alerts(redis_conn, project_id)
+            for project_id in {alert.project_id for alert in alerts}
+        ))
+
+        # Send to Slack concurrently; one failed webhook doesn't stop the others
+        logger.info(f"📤 Sending {len(notifications)} alerts to Slack...")
+        sent = await asyncio.gather(*(send() for _, send in notifications), return_exceptions=True)
+
+        for (label, _), success in zip(notifications, sent):
+            if success is True:
+                logger.info(f"✅ {label} alert sent to Slack")
+            else:
+                logger.warning(f"⚠️  Failed to send {label.lower()} alert")
 
     except Exception as e:
-        print(f"   ⚠️  Error checking/sending alerts: {e}")
+        logger.warning(f"⚠️  Error checking/sending alerts: {e}")
 
 
-if __name__ == "__main__":
-    """Run the worker as a standalone process."""
+async def run_worker() -> None:
+    """
+    Run the evaluation worker on the current event loop.
+
+    On Python 3.12+ tasks start eagerly, so a task whose coroutine finishes
+    without suspending (e.g. a cache hit) never goes through the scheduler.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    await process_evaluation_queue()
+
+
+def main() -> None:
+    """Run the worker as a standalone process (the aether-worker entry point)."""
+    # Settings read .env themselves, but RAGAS reads OPENAI_API_KEY straight
+    # from the environment
+    load_dotenv()
     try:
-        asyncio.run(process_evaluation_queue())
+        asyncio.run(run_worker())
     except KeyboardInterrupt:
-        print("\n👋 Worker stopped by user")
+        logger.info("👋 Worker stopped by user")
         sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
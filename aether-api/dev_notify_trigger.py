@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Install or remove the dev-only evaluation notify trigger.
+
+With it, the test scripts are woken as soon as the worker commits an
+evaluation instead of polling for it. Don't install it in production: it
+sends a notification for every evaluation written.
+
+Usage: python dev_notify_trigger.py install|uninstall
+"""
+import sys
+
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from _evaluation_listener import EVALUATION_READY_CHANNEL, NOTIFY_TRIGGER
+
+# Statement-level, so a batch insert by the worker fires the trigger once;
+# ON CONFLICT skips aren't in the transition table and aren't notified
+INSTALL_STATEMENTS = [
+    f"""
+    CREATE OR REPLACE FUNCTION notify_evaluation_ready() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{EVALUATION_READY_CHANNEL}', trace_id::text) FROM new_evaluations;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    f"DROP TRIGGER IF EXISTS {NOTIFY_TRIGGER} ON evaluations",
+    f"""
+    CREATE TRIGGER {NOTIFY_TRIGGER}
+    AFTER INSERT ON evaluations
+    REFERENCING NEW TABLE AS new_evaluations
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_evaluation_ready()
+    """,
+]
+
+UNINSTALL_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {NOTIFY_TRIGGER} ON evaluations",
+    "DROP FUNCTION IF EXISTS notify_evaluation_ready()",
+]
+
+
+def apply(statements: list[str]) -> None:
+    """Run the statements in one transaction."""
+    with SessionLocal() as db:
+        for statement in statements:
+            db.execute(text(statement))
+        db.commit()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ("install", "uninstall"):
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(2)
+
+    if sys.argv[1] == "install":
+        apply(INSTALL_STATEMENTS)
+        print(f"✅ Installed {NOTIFY_TRIGGER}")
+    else:
+        apply(UNINSTALL_STATEMENTS)
+        print(f"✅ Removed {NOTIFY_TRIGGER}")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Run the API test scripts concurrently as a dev smoke suite"""
+import asyncio
+
+from _http import run
+from test_end_to_end import test_end_to_end
+from test_ragas_faithfulness import test_ragas_faithfulness
+from test_trace_ingestion import test_ingestion
+
+
+async def run_all() -> bool:
+    """Run the independent test flows at once; suite time is the slowest test, not the sum."""
+    names = ["end-to-end", "faithfulness", "ingestion"]
+    results = await asyncio.gather(
+        test_end_to_end(),
+        test_ragas_faithfulness(),
+        test_ingestion(),
+        return_exceptions=True,
+    )
+
+    print("=" * 70)
+    print("📋 Suite Summary")
+    print("=" * 70)
+    passed = True
+    for name, result in zip(names, results):
+        # test_ingestion reports by printing and returns None
+        if isinstance(result, BaseException) or result is False:
+            passed = False
+            print(f"❌ {name}: {result if isinstance(result, BaseException) else 'failed'}")
+        else:
+            print(f"✅ {name}")
+    return passed
+
+
+if __name__ == "__main__":
+    print()
+    success = run(run_all())
+    print()
+
+    if success:
+        exit(0)
+    else:
+        exit(1)
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Seed test data for development"""
 import uuid
-from datetime import datetime
 from app.core.database import SessionLocal
 from app.models import Organization, Project
 from app.models.organization import PlanType
@@ -10,7 +9,8 @@ from app.models.project import EnvironmentType
 
 def seed_test_data():
     """Create test organization and project for development."""
-    db = SessionLocal()
+    # Nothing is read back after the commit, so don't expire (and reload) the objects
+    db = SessionLocal(expire_on_commit=False)
 
     try:
         # Create test organization
@@ -20,34 +20,30 @@ def seed_test_data():
             name="Test Organization",
             plan=PlanType.PRO,
             api_key="ae_test_key_development_12345",
-            created_at=datetime.utcnow()
         )
-        db.add(test_org)
-        db.commit()
-        db.refresh(test_org)
-
-        print("=" * 60)
-        print("✅ Created Test Organization")
-        print("=" * 60)
-        print(f"Organization ID: {test_org.id}")
-        print(f"Name: {test_org.name}")
-        print(f"Plan: {test_org.plan.value}")
-        print(f"API Key: {test_org.api_key}")
-        print()
 
         # Create test project
         project_id = uuid.uuid4()
         test_project = Project(
             id=project_id,
-            org_id=test_org.id,
+            org_id=org_id,
             name="Test RAG System",
             description="Development testing project",
             environment=EnvironmentType.DEVELOPMENT,
-            created_at=datetime.utcnow()
         )
-        db.add(test_project)
+
+        # One transaction; the unit of work inserts the organization first
+        db.add_all([test_org, test_project])
         db.commit()
-        db.refresh(test_project)
+
+        print("=" * 60)
+        print("✅ Created Test Organization")
+        print("=" * 60)
+        print(f"Organization ID: {test_org.id}")
+        print(f"Name: {test_org.name}")
+        print(f"Plan: {test_org.plan.value}")
+        print(f"API Key: {test_org.api_key}")
+        print()
 
         print("=" * 60)
         print("✅ Created Test Project")
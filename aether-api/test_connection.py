@@ -2,7 +2,7 @@
 """Test database connection"""
 import os
 from dotenv import load_dotenv
-import psycopg2
+import psycopg
 
 load_dotenv()
 
@@ -10,7 +10,7 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 print(f"Testing connection: {DATABASE_URL}")
 
 try:
-    conn = psycopg2.connect(DATABASE_URL)
+    conn = psycopg.connect(DATABASE_URL)
     print("✅ Connection successful!")
 
     cursor = conn.cursor()
@@ -7,14 +7,15 @@ Tests the complete flow:
 2. Worker processes evaluation queue
 3. Evaluation results saved to database
 """
-import httpx
-import asyncio
-import time
 from datetime import datetime
+import orjson
 from app.core.database import SessionLocal
 from app.models import Evaluation
 from uuid import UUID
 
+from _evaluation_listener import EvaluationListener
+from _http import JSON_HEADERS, get_client, run
+
 
 async def test_end_to_end():
     """Test complete trace ingestion and evaluation flow."""
@@ -54,10 +55,14 @@ async def test_end_to_end():
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
 
-    async with httpx.AsyncClient() as client:
+    client = get_client()
+
+    # Listen before ingesting so the worker's notification can't be missed
+    async with EvaluationListener() as listener:
         response = await client.post(
-            "http://127.0.0.1:8000/api/v1/traces/",
-            json=trace_data,
+            "/api/v1/traces/",
+            content=orjson.dumps(trace_data),
+            headers=JSON_HEADERS,
             timeout=10.0
         )
 
@@ -76,29 +81,19 @@ async def test_end_to_end():
         print("   (Note: Make sure worker is running with: python -m app.workers.evaluator)")
         print()
 
-        # Poll database for evaluation (timeout after 30 seconds)
-        db = SessionLocal()
-        evaluation = None
-        max_attempts = 30
-        attempt = 0
+        # Wait for the worker's insert (timeout after 30 seconds)
+        max_wait = 30
+        await listener.wait_for(trace_id, timeout=max_wait)
 
-        while attempt < max_attempts:
+        # Fetch once - also catches an evaluation whose notification we missed
+        with SessionLocal() as db:
             evaluation = db.query(Evaluation).filter(
                 Evaluation.trace_id == UUID(trace_id)
             ).first()
 
-            if evaluation:
-                break
-
-            attempt += 1
-            print(f"   Waiting... ({attempt}/{max_attempts})")
-            await asyncio.sleep(1)
-
-        db.close()
-
         if not evaluation:
             print()
-            print(f"⚠️  Evaluation not found after {max_attempts} seconds")
+            print(f"⚠️  Evaluation not found after {max_wait} seconds")
             print("   This is expected if the worker is not running.")
             print("   To complete the test, run the worker in another terminal:")
             print("   python -m app.workers.evaluator")
@@ -169,7 +164,7 @@ async def test_end_to_end():
 
 if __name__ == "__main__":
     print()
-    success = asyncio.run(test_end_to_end())
+    success = run(test_end_to_end())
     print()
 
     if success:
@@ -8,13 +8,15 @@ This script:
 3. Verifies faithfulness score was computed
 4. Shows the evaluation results
 """
-import httpx
-import asyncio
 from datetime import datetime
+import orjson
 from app.core.database import SessionLocal
 from app.models import Evaluation
 from uuid import UUID
 
+from _evaluation_listener import EvaluationListener
+from _http import JSON_HEADERS, get_client, run
+
 
 async def test_ragas_faithfulness():
     """Test faithfulness evaluation with a case that should score poorly."""
@@ -54,10 +56,14 @@ async def test_ragas_faithfulness():
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
 
-    async with httpx.AsyncClient() as client:
+    client = get_client()
+
+    # Listen before ingesting so the worker's notification can't be missed
+    async with EvaluationListener() as listener:
         response = await client.post(
-            "http://127.0.0.1:8000/api/v1/traces/",
-            json=trace_data,
+            "/api/v1/traces/",
+            content=orjson.dumps(trace_data),
+            headers=JSON_HEADERS,
             timeout=10.0
         )
 
@@ -76,29 +82,20 @@ async def test_ragas_faithfulness():
         print("   (Worker must be running: python -m app.workers.evaluator)")
         print()
 
-        db = SessionLocal()
-        evaluation = None
-        max_attempts = 60  # Wait up to 60 seconds for LLM evaluation
-        attempt = 0
+        # Faithfulness is scored before the row is inserted, so once the row
+        # exists it's ready (wait up to 60 seconds for LLM evaluation)
+        max_wait = 60
+        await listener.wait_for(trace_id, timeout=max_wait)
 
-        while attempt < max_attempts:
+        # Fetch once - also catches an evaluation whose notification we missed
+        with SessionLocal() as db:
             evaluation = db.query(Evaluation).filter(
                 Evaluation.trace_id == UUID(trace_id)
             ).first()
 
-            if evaluation and evaluation.faithfulness is not None:
-                break
-
-            attempt += 1
-            if attempt % 5 == 0:
-                print(f"   Waiting... ({attempt}/{max_attempts}s)")
-            await asyncio.sleep(1)
-
-        db.close()
-
         if not evaluation:
             print()
-            print(f"⚠️  Evaluation not found after {max_attempts} seconds")
+            print(f"⚠️  Evaluation not found after {max_wait} seconds")
             print("   Make sure:")
             print("   1. Worker is running: python -m app.workers.evaluator")
             print("   2. OpenAI API key is set in .env")
@@ -184,7 +181,7 @@ async def test_ragas_faithfulness():
 
 if __name__ == "__main__":
     print()
-    success = asyncio.run(test_ragas_faithfulness())
+    success = run(test_ragas_faithfulness())
     print()
 
     if success:
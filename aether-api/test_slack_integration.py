@@ -9,14 +9,17 @@ Tests the complete flow:
 4. Alert sent to Slack
 5. Alert saved to database
 """
-import requests
-import time
+import httpx
+import orjson
 from uuid import UUID
 
+from app.core.database import SessionLocal
+from app.models import Evaluation
+from _evaluation_listener import EvaluationListener
+from _http import JSON_HEADERS, get_client, run
+
 # Configuration
-API_BASE_URL = "http://127.0.0.1:8000"
 PROJECT_ID = "2afd5cf5-0a7e-4859-b6ba-4c238f15539c"  # From seed_data.py
-API_KEY = "ae_test_key_development_12345"
 
 # IMPORTANT: You need to provide a real Slack webhook URL to test
 # Get one from https://api.slack.com/messaging/webhooks
@@ -37,9 +40,6 @@ print("🧪 Aether Slack Alerting Integration Test")
 print("=" * 70)
 print()
 
-# Step 1: Configure alert settings
-print("1️⃣  Configuring alert settings...")
-
 alert_config = {
     "slack_webhook_url": SLACK_WEBHOOK_URL if SLACK_WEBHOOK_URL else None,
     "slack_enabled": bool(SLACK_WEBHOOK_URL),
@@ -51,33 +51,6 @@ alert_config = {
     "latency_alerts_enabled": True
 }
 
-# Try to create, or update if exists
-try:
-    response = requests.post(
-        f"{API_BASE_URL}/api/v1/alert-config/{PROJECT_ID}",
-        json=alert_config,
-        timeout=5
-    )
-    if response.status_code == 409:  # Already exists
-        print("   Alert config already exists, updating...")
-        response = requests.put(
-            f"{API_BASE_URL}/api/v1/alert-config/{PROJECT_ID}",
-            json=alert_config,
-            timeout=5
-        )
-    response.raise_for_status()
-    print(f"   ✅ Alert config saved")
-    print(f"   Slack enabled: {bool(SLACK_WEBHOOK_URL)}")
-    print(f"   Hallucination threshold: 0.5")
-    print()
-except requests.exceptions.RequestException as e:
-    print(f"   ❌ Failed to configure alerts: {e}")
-    print(f"   Response: {response.text if 'response' in locals() else 'No response'}")
-    exit(1)
-
-# Step 2: Ingest a trace with intentional hallucination
-print("2️⃣  Ingesting trace with hallucination...")
-
 trace_data = {
     "project_id": PROJECT_ID,
     "query": "What is the capital of Germany?",
@@ -104,104 +77,126 @@ trace_data = {
     "cost_usd": 0.011
 }
 
-headers = {"X-API-Key": API_KEY}
-
-try:
-    response = requests.post(
-        f"{API_BASE_URL}/api/v1/traces",
-        json=trace_data,
-        headers=headers,
-        timeout=5
-    )
-    response.raise_for_status()
-    trace_result = response.json()
-    trace_id = trace_result["trace_id"]
-    print(f"   ✅ Trace ingested: {trace_id}")
-    print()
-except requests.exceptions.RequestException as e:
-    print(f"   ❌ Failed to ingest trace: {e}")
-    exit(1)
+max_wait = 30  # seconds
 
-# Step 3: Wait for worker to process
-print("3️⃣  Waiting for evaluation worker to process...")
-print("   (Make sure the worker is running with: python run_worker_once.py)")
-print()
 
-# Poll for evaluation completion
-max_wait = 30  # seconds
-start_time = time.time()
-evaluation_complete = False
+async def main() -> bool:
+    """Run the Slack alerting integration test."""
+    client = get_client()
+
+    # Step 1: Configure alert settings
+    print("1️⃣  Configuring alert settings...")
 
-while (time.time() - start_time) < max_wait:
+    # Try to create, or update if exists (same serialized body for both)
+    config_body = orjson.dumps(alert_config)
+    response = None
     try:
-        response = requests.get(
-            f"{API_BASE_URL}/api/v1/traces/{trace_id}",
-            headers=headers,
-            timeout=5
+        response = await client.post(
+            f"/api/v1/alert-config/{PROJECT_ID}", content=config_body, headers=JSON_HEADERS
         )
+        if response.status_code == 409:  # Already exists
+            print("   Alert config already exists, updating...")
+            response = await client.put(
+                f"/api/v1/alert-config/{PROJECT_ID}", content=config_body, headers=JSON_HEADERS
+            )
         response.raise_for_status()
-        trace_data = response.json()
-
-        if trace_data.get("evaluation"):
-            evaluation_complete = True
-            print(f"   ✅ Evaluation complete!")
-            print(f"      Faithfulness: {trace_data['evaluation'].get('faithfulness', 'N/A')}")
-            print(f"      Hallucination detected: {trace_data['evaluation'].get('hallucination_detected', False)}")
-            print(f"      Token overlap: {trace_data['evaluation'].get('token_overlap_ratio', 0):.2%}")
+        print(f"   ✅ Alert config saved")
+        print(f"   Slack enabled: {bool(SLACK_WEBHOOK_URL)}")
+        print(f"   Hallucination threshold: 0.5")
+        print()
+    except httpx.HTTPError as e:
+        print(f"   ❌ Failed to configure alerts: {e}")
+        print(f"   Response: {response.text if response is not None else 'No response'}")
+        return False
+
+    # Listen before ingesting so the worker's notification can't be missed
+    async with EvaluationListener() as listener:
+        # Step 2: Ingest a trace with intentional hallucination
+        print("2️⃣  Ingesting trace with hallucination...")
+
+        try:
+            response = await client.post(
+                "/api/v1/traces/", content=orjson.dumps(trace_data), headers=JSON_HEADERS
+            )
+            response.raise_for_status()
+            trace_id = response.json()["trace_id"]
+            print(f"   ✅ Trace ingested: {trace_id}")
             print()
-            break
-
-        time.sleep(2)
-        print("   ⏳ Still processing...")
-
-    except requests.exceptions.RequestException as e:
-        print(f"   ⚠️  Error checking trace: {e}")
-        time.sleep(2)
-
-if not evaluation_complete:
-    print("   ⚠️  Evaluation did not complete within 30 seconds")
-    print("   Make sure the worker is running!")
-    exit(1)
-
-# Step 4: Check for alert in database
-print("4️⃣  Checking for alerts...")
-
-try:
-    response = requests.get(
-        f"{API_BASE_URL}/api/v1/alerts/{PROJECT_ID}?resolved=false",
-        timeout=5
-    )
-    response.raise_for_status()
-    alerts_data = response.json()
-
-    if alerts_data["total"] > 0:
-        print(f"   ✅ Found {alerts_data['total']} alert(s)")
-        for alert in alerts_data["alerts"]:
-            print(f"\n   Alert Details:")
-            print(f"   - Type: {alert['alert_type']}")
-            print(f"   - Severity: {alert['severity']}")
-            print(f"   - Message: {alert['message']}")
-            print(f"   - Created: {alert['created_at']}")
-            if alert.get("alert_metadata"):
-                print(f"   - Metadata: {alert['alert_metadata']}")
+        except httpx.HTTPError as e:
+            print(f"   ❌ Failed to ingest trace: {e}")
+            return False
+
+        # Step 3: Wait for worker to process
+        print("3️⃣  Waiting for evaluation worker to process...")
+        print("   (Make sure the worker is running with: python run_worker_once.py)")
+        print()
+        await listener.wait_for(trace_id, timeout=max_wait)
+
+    # The trace API doesn't return evaluations, so read the row directly.
+    # Fetching even after a timeout also catches a notification we missed.
+    with SessionLocal() as db:
+        evaluation = db.query(Evaluation).filter(
+            Evaluation.trace_id == UUID(trace_id)
+        ).first()
+
+    if evaluation is None:
+        print(f"   ⚠️  Evaluation did not complete within {max_wait} seconds")
+        print("   Make sure the worker is running!")
+        return False
+
+    faithfulness = f"{evaluation.faithfulness:.2f}" if evaluation.faithfulness is not None else "N/A"
+    print(f"   ✅ Evaluation complete!")
+    print(f"      Faithfulness: {faithfulness}")
+    print(f"      Hallucination detected: {evaluation.hallucination_detected}")
+    print(f"      Token overlap: {evaluation.token_overlap_ratio or 0:.2%}")
+    print()
+
+    # Step 4: Check for alert in database
+    print("4️⃣  Checking for alerts...")
+
+    try:
+        response = await client.get(f"/api/v1/alerts/{PROJECT_ID}", params={"resolved": "false"})
+        response.raise_for_status()
+        alerts_data = response.json()
+
+        if alerts_data["total"] > 0:
+            print(f"   ✅ Found {alerts_data['total']} alert(s)")
+            for alert in alerts_data["alerts"]:
+                print(f"\n   Alert Details:")
+                print(f"   - Type: {alert['alert_type']}")
+                print(f"   - Severity: {alert['severity']}")
+                print(f"   - Message: {alert['message']}")
+                print(f"   - Created: {alert['created_at']}")
+                if alert.get("alert_metadata"):
+                    print(f"   - Metadata: {alert['alert_metadata']}")
+        else:
+            print("   ⚠️  No alerts found (this might be expected if hallucination score was above threshold)")
+
+    except httpx.HTTPError as e:
+        print(f"   ⚠️  Error fetching alerts: {e}")
+
+    print()
+    print("=" * 70)
+    print("✅ Slack Integration Test Complete")
+    print("=" * 70)
+    print()
+
+    if SLACK_WEBHOOK_URL:
+        print("Check your Slack channel for the alert notification!")
     else:
-        print("   ⚠️  No alerts found (this might be expected if hallucination score was above threshold)")
+        print("To test Slack notifications:")
+        print("1. Get a webhook URL from https://api.slack.com/messaging/webhooks")
+        print("2. Update the alert config with: PUT /api/v1/alert-config/{project_id}")
+        print("3. Ingest a new trace with hallucination")
+        print("4. Watch for Slack notification!")
+    print()
+    return True
 
-except requests.exceptions.RequestException as e:
-    print(f"   ⚠️  Error fetching alerts: {e}")
 
-print()
-print("=" * 70)
-print("✅ Slack Integration Test Complete")
-print("=" * 70)
-print()
+if __name__ == "__main__":
+    success = run(main())
 
-if SLACK_WEBHOOK_URL:
-    print("Check your Slack channel for the alert notification!")
-else:
-    print("To test Slack notifications:")
-    print("1. Get a webhook URL from https://api.slack.com/messaging/webhooks")
-    print("2. Update the alert config with: PUT /api/v1/alert-config/{project_id}")
-    print("3. Ingest a new trace with hallucination")
-    print("4. Watch for Slack notification!")
-print()
+    if success:
+        exit(0)
+    else:
+        exit(1)
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Test trace ingestion endpoint"""
-import httpx
-import asyncio
 from datetime import datetime
 
+import orjson
+
+from _http import JSON_HEADERS, get_client, run
+
 
 async def test_ingestion():
     """Test the trace ingestion and retrieval flow."""
@@ -43,91 +45,89 @@ async def test_ingestion():
         "timestamp": datetime.utcnow().isoformat() + "Z"
     }
 
-    async with httpx.AsyncClient() as client:
-        print("=" * 70)
-        print("🚀 Testing Trace Ingestion")
-        print("=" * 70)
-        print(f"Project ID: {project_id}")
-        print(f"Query: {test_data['query']}")
-        print(f"Contexts: {len(test_data['contexts'])} documents")
-        print()
-
-        # Test trace ingestion
-        print("📤 Sending trace to API...")
-        try:
-            response = await client.post(
-                "http://127.0.0.1:8000/api/v1/traces/",
-                json=test_data,
-                headers={"Content-Type": "application/json"},
-                timeout=10.0
-            )
-
-            print(f"Status Code: {response.status_code}")
+    client = get_client()
+    print("=" * 70)
+    print("🚀 Testing Trace Ingestion")
+    print("=" * 70)
+    print(f"Project ID: {project_id}")
+    print(f"Query: {test_data['query']}")
+    print(f"Contexts: {len(test_data['contexts'])} documents")
+    print()
 
-            if response.status_code == 202:
-                result = response.json()
-                trace_id = result["trace_id"]
-                status = result["status"]
+    # Test trace ingestion
+    print("📤 Sending trace to API...")
+    try:
+        response = await client.post(
+            "/api/v1/traces/",
+            content=orjson.dumps(test_data),
+            headers=JSON_HEADERS,
+            timeout=10.0
+        )
+
+        print(f"Status Code: {response.status_code}")
+
+        if response.status_code == 202:
+            result = response.json()
+            trace_id = result["trace_id"]
+            status = result["status"]
+
+            print()
+            print("=" * 70)
+            print("✅ Trace Ingestion Successful")
+            print("=" * 70)
+            print(f"Trace ID: {trace_id}")
+            print(f"Status: {status}")
+            print()
+
+            # The ingest endpoint commits before returning 202, so the trace is readable now
+            # Test trace retrieval
+            print("=" * 70)
+            print("📥 Retrieving Trace")
+            print("=" * 70)
+            get_response = await client.get(
+                f"/api/v1/traces/{trace_id}",
+                timeout=5.0
+            )
 
+            if get_response.status_code == 200:
+                trace = get_response.json()
+                print(f"✅ Successfully retrieved trace")
                 print()
-                print("=" * 70)
-                print("✅ Trace Ingestion Successful")
-                print("=" * 70)
-                print(f"Trace ID: {trace_id}")
-                print(f"Status: {status}")
+                print(f"Query: {trace['query']}")
+                print(f"Response length: {len(trace['response'])} chars")
+                print(f"Contexts: {len(trace['contexts'])} documents")
+                print(f"Token count: {trace['token_count']}")
+                print(f"Latency: {trace['latency_ms']}ms")
+                print(f"Cost: ${trace['cost_usd']}")
+                print(f"Created: {trace['created_at']}")
                 print()
 
-                # Wait a moment for DB write
-                await asyncio.sleep(0.5)
-
-                # Test trace retrieval
                 print("=" * 70)
-                print("📥 Retrieving Trace")
+                print("🎯 Next Steps")
                 print("=" * 70)
-                get_response = await client.get(
-                    f"http://127.0.0.1:8000/api/v1/traces/{trace_id}",
-                    timeout=5.0
-                )
-
-                if get_response.status_code == 200:
-                    trace = get_response.json()
-                    print(f"✅ Successfully retrieved trace")
-                    print()
-                    print(f"Query: {trace['query']}")
-                    print(f"Response length: {len(trace['response'])} chars")
-                    print(f"Contexts: {len(trace['contexts'])} documents")
-                    print(f"Token count: {trace['token_count']}")
-                    print(f"Latency: {trace['latency_ms']}ms")
-                    print(f"Cost: ${trace['cost_usd']}")
-                    print(f"Created: {trace['created_at']}")
-                    print()
-
-                    print("=" * 70)
-                    print("🎯 Next Steps")
-                    print("=" * 70)
-                    print("1. Check database:")
-                    print(f"   psql aether -c \"SELECT id, query FROM rag_traces WHERE id='{trace_id}';\"")
-                    print()
-                    print("2. Check Redis queue:")
-                    print("   redis-cli")
-                    print("   > LLEN evaluation_queue")
-                    print("   > LRANGE evaluation_queue 0 -1")
-                    print()
-                else:
-                    print(f"❌ Failed to retrieve trace: {get_response.status_code}")
-                    print(f"Response: {get_response.text}")
-
-            else:
+                print("1. Check database:")
+                print(f"   psql aether -c \"SELECT id, query FROM rag_traces WHERE id='{trace_id}';\"")
                 print()
-                print(f"❌ Trace ingestion failed: {response.status_code}")
-                print(f"Response: {response.text}")
+                print("2. Check Redis queue:")
+                print("   redis-cli")
+                print("   > XLEN evaluation_stream")
+                print("   > XRANGE evaluation_stream - +")
+                print()
+            else:
+                print(f"❌ Failed to retrieve trace: {get_response.status_code}")
+                print(f"Response: {get_response.text}")
+
+        else:
+            print()
+            print(f"❌ Trace ingestion failed: {response.status_code}")
+            print(f"Response: {response.text}")
 
-        except Exception as e:
-            print(f"❌ Error during test: {e}")
-            raise
+    except Exception as e:
+        print(f"❌ Error during test: {e}")
+        raise
 
 
 if __name__ == "__main__":
     print()
-    asyncio.run(test_ingestion())
+    run(test_ingestion())
     print()